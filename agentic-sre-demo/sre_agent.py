@@ -11,11 +11,11 @@ from agno.storage.json import JsonStorage
 from agno.tools.mcp import MultiMCPTools
 from agno.knowledge import AgentKnowledge
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import jwt
+import orjson
 import ssl
 import grpc
 from opentelemetry import trace
@@ -27,6 +27,10 @@ import redis
 import sqlite3
 import os
 
+# Shared JSON serializer
+def dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -251,7 +255,7 @@ class SREAgentCore:
                 self.redis_client.setex(
                     f"conversation:{span.get_span_context().trace_id}",
                     3600,  # 1 hour TTL
-                    json.dumps({
+                    dumps({
                         "user_input": user_input,
                         "agent_response": response.content,
                         "timestamp": datetime.utcnow().isoformat()
@@ -404,8 +408,8 @@ class SREAgentCore:
                 span.record_exception(e)
                 return {"error": f"Failed to investigate incident: {str(e)}"}
     
-    async def monitor_alerts(self, severity: Optional[str] = None) -> Dict[str, Any]:
-        """Monitor alerts with filtering and tracing"""
+    async def monitor_alerts(self, severity: Optional[str] = None, analyze: bool = True) -> Dict[str, Any]:
+        """Monitor alerts with filtering and tracing; analyze=False skips the LLM pattern analysis"""
         with tracer.start_as_current_span("monitor_alerts") as span:
             span.set_attribute("severity_filter", severity or "all")
             
@@ -415,7 +419,13 @@ class SREAgentCore:
                 span.set_attribute("alerts_count", len(alerts))
                 
                 # Analyze alert patterns
-                if alerts:
+                if alerts and not analyze:
+                    return {
+                        "alerts": alerts,
+                        "count": len(alerts),
+                        "trace_id": span.get_span_context().trace_id
+                    }
+                elif alerts:
                     analysis_prompt = f"Analyze these alerts: {alerts}"
                     analysis = await self.agent.arun(analysis_prompt)
                     
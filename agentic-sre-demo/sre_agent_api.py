@@ -4,16 +4,21 @@ SRE Agent REST API - Final Architecture Implementation
 Based on the comprehensive architecture with JWT auth, mTLS, and OTLP traces
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Header, Request
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, WebSocket, WebSocketDisconnect
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, Any, List
 import uvicorn
+import asyncio
 import jwt
 import ssl
+import time
 import logging
+import structlog
+import orjson
+import grpc
 from datetime import datetime, timedelta
 import os
 from opentelemetry import trace
@@ -26,22 +31,33 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 # Import the updated SRE agent
 from sre_agent import get_sre_agent, SREAgentCore
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Initialize OpenTelemetry tracing
-trace.set_tracer_provider(
-    TracerProvider(
-        resource=Resource.create({"service.name": "sre-agent-api"})
-    )
-)
-otlp_exporter = OTLPSpanExporter(endpoint="http://localhost:4317")
-trace.get_tracer_provider().add_span_processor(
-    BatchSpanProcessor(otlp_exporter)
+# Configure logging; calls below INFO resolve to no-ops without building a record
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    cache_logger_on_first_use=True
 )
+logger = structlog.get_logger(__name__)
+
+# OpenTelemetry tracing; the exporter is created on startup (see _init_tracing)
+# so importing this module in tests/CLI tools doesn't open a gRPC channel.
 tracer = trace.get_tracer(__name__)
 
+def _init_tracing():
+    """Install the tracer provider and OTLP exporter"""
+    trace.set_tracer_provider(
+        TracerProvider(
+            resource=Resource.create({"service.name": "sre-agent-api"})
+        )
+    )
+    otlp_exporter = OTLPSpanExporter(
+        endpoint=os.getenv("OTLP_ENDPOINT", "http://localhost:4317"),
+        insecure=True,
+        compression=grpc.Compression.Gzip
+    )
+    trace.get_tracer_provider().add_span_processor(
+        BatchSpanProcessor(otlp_exporter)
+    )
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SRE AI Agent API",
@@ -51,13 +67,20 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
-# Add CORS middleware
+# Add CORS middleware with pinned origins/methods so preflights hit
+# Starlette's exact-match path and can be cached by the browser
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:8501").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
 # Instrument FastAPI with OpenTelemetry
@@ -65,14 +88,21 @@ FastAPIInstrumentor.instrument_app(app)
 
 # Security configuration
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
+JWT_SECRET_BYTES = JWT_SECRET.encode()  # encoded once, not on every sign/verify
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+DEFAULT_TOKEN_EXPIRES = timedelta(minutes=15)
 
 # Security schemas
 security = HTTPBearer()
 
 # Pydantic models
+# Inbound request bodies are read-only once parsed
+REQUEST_MODEL_CONFIG = ConfigDict(strict=False, frozen=True, extra="ignore")
+
 class ChatRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     message: str
     context: Optional[Dict[str, Any]] = None
     user_id: Optional[str] = None
@@ -91,14 +121,20 @@ class HealthResponse(BaseModel):
     trace_id: str
 
 class IncidentRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     incident_id: str
     description: Optional[str] = None
 
 class AlertRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     severity: Optional[str] = None
     service: Optional[str] = None
 
 class AuthRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     username: str
     password: str
 
@@ -108,27 +144,28 @@ class AuthResponse(BaseModel):
     expires_in: int
 
 # JWT token management
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+def create_access_token(sub: str, permissions: List[str], expires_delta: timedelta = DEFAULT_TOKEN_EXPIRES):
     """Create JWT access token"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    exp = int(time.time()) + int(expires_delta.total_seconds())
+    return jwt.encode(
+        {"sub": sub, "permissions": permissions, "exp": exp},
+        JWT_SECRET_BYTES,
+        algorithm=JWT_ALGORITHM
+    )
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
-    """Verify JWT token"""
+def decode_token(token: str) -> Dict[str, Any]:
+    """Decode and validate a raw JWT"""
     try:
-        payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload
+        return jwt.decode(token, JWT_SECRET_BYTES, algorithms=[JWT_ALGORITHM])
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
 
+def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+    """Verify JWT token"""
+    return decode_token(credentials.credentials)
+
 # Mock user database (in production, use real database)
 USERS_DB = {
     "admin": {
@@ -155,11 +192,13 @@ sre_agent: Optional[SREAgentCore] = None
 async def startup_event():
     """Initialize the SRE agent on startup"""
     global sre_agent
+    if os.getenv("OTEL_ENABLED", "1") == "1":
+        _init_tracing()
     try:
         sre_agent = get_sre_agent()
         logger.info("SRE Agent initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize SRE Agent: {e}")
+        logger.error("Failed to initialize SRE Agent", error=str(e))
         raise
 
 @app.on_event("shutdown")
@@ -185,12 +224,13 @@ async def login(auth_request: AuthRequest):
         # Create access token
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user["username"], "permissions": user["permissions"]},
+            user["username"],
+            user["permissions"],
             expires_delta=access_token_expires
         )
         
         span.set_attribute("login_success", True)
-        span.set_attribute("user_permissions", str(user["permissions"]))
+        span.set_attribute("user_permissions", user["permissions"])
         
         return AuthResponse(
             access_token=access_token,
@@ -201,22 +241,41 @@ async def login(auth_request: AuthRequest):
 @app.post("/auth/verify")
 async def verify_auth(token_data: Dict[str, Any] = Depends(verify_token)):
     """Verify authentication token"""
-    with tracer.start_as_current_span("verify_auth") as span:
-        span.set_attribute("user_id", token_data.get("sub", "unknown"))
-        span.set_attribute("permissions", str(token_data.get("permissions", [])))
-        
-        return {
-            "valid": True,
-            "user_id": token_data.get("sub"),
-            "permissions": token_data.get("permissions", []),
-            "expires_at": token_data.get("exp")
-        }
+    span = trace.get_current_span()
+    span.set_attribute("user_id", token_data.get("sub", "unknown"))
+    span.set_attribute("permissions", token_data.get("permissions", []))
+    
+    return {
+        "valid": True,
+        "user_id": token_data.get("sub"),
+        "permissions": token_data.get("permissions", []),
+        "expires_at": token_data.get("exp")
+    }
 
 # Health check endpoint
+# Healthy results are shared for a short window so bursts of LB probes
+# don't each re-run the component checks. Only the payload is cached;
+# every response carries its own request's trace_id.
+HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: Optional[tuple] = None  # (expires_at, (status, components, timestamp))
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """System health check with comprehensive component status"""
+    global _health_cache
+    
     with tracer.start_as_current_span("api_health_check") as span:
+        if _health_cache and _health_cache[0] > time.monotonic():
+            status, components, timestamp = _health_cache[1]
+            span.set_attribute("health_status", status)
+            span.set_attribute("cached", True)
+            return HealthResponse(
+                status=status,
+                components=components,
+                timestamp=timestamp,
+                trace_id=span.get_span_context().trace_id
+            )
+        
         try:
             if not sre_agent:
                 raise HTTPException(status_code=503, detail="SRE Agent not initialized")
@@ -224,14 +283,22 @@ async def health_check():
             health_result = await sre_agent.health_check()
             
             span.set_attribute("health_status", health_result.get("status", "unknown"))
-            span.set_attribute("components_healthy", str(health_result.get("components", {})))
+            for component, healthy in health_result.get("components", {}).items():
+                span.set_attribute(f"component.{component}", bool(healthy))
             
-            return HealthResponse(
+            response = HealthResponse(
                 status=health_result.get("status", "unknown"),
                 components=health_result.get("components", {}),
                 timestamp=health_result.get("timestamp", datetime.utcnow().isoformat()),
                 trace_id=health_result.get("trace_id", span.get_span_context().trace_id)
             )
+            if response.status == "healthy":
+                _health_cache = (
+                    time.monotonic() + HEALTH_CACHE_TTL_SECONDS,
+                    (response.status, response.components, response.timestamp)
+                )
+            
+            return response
             
         except Exception as e:
             span.record_exception(e)
@@ -253,9 +320,7 @@ async def chat_with_agent(
                 raise HTTPException(status_code=503, detail="SRE Agent not initialized")
             
             # Create JWT token for agent authentication
-            jwt_token = create_access_token(
-                data={"sub": token_data.get("sub"), "permissions": token_data.get("permissions", [])}
-            )
+            jwt_token = create_access_token(token_data.get("sub"), token_data.get("permissions", []))
             
             # Process request with agent
             result = await sre_agent.process_request(request.message, jwt_token)
@@ -300,9 +365,7 @@ async def investigate_incident(
                 raise HTTPException(status_code=403, detail="Insufficient permissions for incident investigation")
             
             # Create JWT token for agent authentication
-            jwt_token = create_access_token(
-                data={"sub": token_data.get("sub"), "permissions": token_data.get("permissions", [])}
-            )
+            jwt_token = create_access_token(token_data.get("sub"), token_data.get("permissions", []))
             
             result = await sre_agent.investigate_incident(request.incident_id, jwt_token)
             
@@ -345,9 +408,7 @@ async def monitor_alerts(
                 raise HTTPException(status_code=403, detail="Insufficient permissions for alert monitoring")
             
             # Create JWT token for agent authentication
-            jwt_token = create_access_token(
-                data={"sub": token_data.get("sub"), "permissions": token_data.get("permissions", [])}
-            )
+            jwt_token = create_access_token(token_data.get("sub"), token_data.get("permissions", []))
             
             result = await sre_agent.monitor_alerts(severity)
             
@@ -372,43 +433,45 @@ async def monitor_alerts(
             raise HTTPException(status_code=500, detail=f"Alert monitoring failed: {str(e)}")
 
 # System metrics endpoint
+# The read-only mock endpoints below reuse the request span created by
+# FastAPIInstrumentor instead of opening a child span of their own.
 @app.get("/metrics/system")
 async def get_system_metrics(
     token_data: Dict[str, Any] = Depends(verify_token)
 ):
     """Get system metrics"""
-    with tracer.start_as_current_span("get_system_metrics") as span:
-        span.set_attribute("user_id", token_data.get("sub", "unknown"))
+    span = trace.get_current_span()
+    span.set_attribute("user_id", token_data.get("sub", "unknown"))
+    
+    try:
+        if not sre_agent:
+            raise HTTPException(status_code=503, detail="SRE Agent not initialized")
         
-        try:
-            if not sre_agent:
-                raise HTTPException(status_code=503, detail="SRE Agent not initialized")
-            
-            # Check permissions
-            if "metrics" not in token_data.get("permissions", []):
-                raise HTTPException(status_code=403, detail="Insufficient permissions for system metrics")
-            
-            # Mock system metrics for now
-            metrics = {
-                "cpu_usage": 45.2,
-                "memory_usage": 67.8,
-                "disk_usage": 23.1,
-                "network_latency": 12.5,
-                "active_connections": 1250,
-                "error_rate": 0.02
-            }
-            
-            span.set_attribute("metrics_retrieved", True)
-            
-            return {
-                "metrics": metrics,
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": span.get_span_context().trace_id
-            }
-            
-        except Exception as e:
-            span.record_exception(e)
-            raise HTTPException(status_code=500, detail=f"Failed to get system metrics: {str(e)}")
+        # Check permissions
+        if "metrics" not in token_data.get("permissions", []):
+            raise HTTPException(status_code=403, detail="Insufficient permissions for system metrics")
+        
+        # Mock system metrics for now
+        metrics = {
+            "cpu_usage": 45.2,
+            "memory_usage": 67.8,
+            "disk_usage": 23.1,
+            "network_latency": 12.5,
+            "active_connections": 1250,
+            "error_rate": 0.02
+        }
+        
+        span.set_attribute("metrics_retrieved", True)
+        
+        return {
+            "metrics": metrics,
+            "timestamp": datetime.utcnow().isoformat(),
+            "trace_id": span.get_span_context().trace_id
+        }
+        
+    except Exception as e:
+        span.record_exception(e)
+        raise HTTPException(status_code=500, detail=f"Failed to get system metrics: {str(e)}")
 
 # Performance data endpoint
 @app.get("/performance/data")
@@ -418,64 +481,206 @@ async def get_performance_data(
     token_data: Dict[str, Any] = Depends(verify_token)
 ):
     """Get performance data for services"""
-    with tracer.start_as_current_span("get_performance_data") as span:
-        span.set_attribute("service", service or "all")
-        span.set_attribute("timeframe", timeframe)
-        span.set_attribute("user_id", token_data.get("sub", "unknown"))
+    span = trace.get_current_span()
+    span.set_attribute("service", service or "all")
+    span.set_attribute("timeframe", timeframe)
+    span.set_attribute("user_id", token_data.get("sub", "unknown"))
+    
+    try:
+        if not sre_agent:
+            raise HTTPException(status_code=503, detail="SRE Agent not initialized")
         
-        try:
-            if not sre_agent:
-                raise HTTPException(status_code=503, detail="SRE Agent not initialized")
-            
-            # Check permissions
-            if "performance" not in token_data.get("permissions", []):
-                raise HTTPException(status_code=403, detail="Insufficient permissions for performance data")
-            
-            # Mock performance data
-            performance_data = {
-                "response_times": {
-                    "p50": 150,
-                    "p95": 450,
-                    "p99": 1200
-                },
-                "throughput": 1250,
-                "error_rate": 0.015,
-                "availability": 99.95
-            }
-            
-            span.set_attribute("performance_data_retrieved", True)
-            
-            return {
-                "service": service or "all",
-                "timeframe": timeframe,
-                "data": performance_data,
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": span.get_span_context().trace_id
-            }
-            
-        except Exception as e:
-            span.record_exception(e)
-            raise HTTPException(status_code=500, detail=f"Failed to get performance data: {str(e)}")
+        # Check permissions
+        if "performance" not in token_data.get("permissions", []):
+            raise HTTPException(status_code=403, detail="Insufficient permissions for performance data")
+        
+        # Mock performance data
+        performance_data = {
+            "response_times": {
+                "p50": 150,
+                "p95": 450,
+                "p99": 1200
+            },
+            "throughput": 1250,
+            "error_rate": 0.015,
+            "availability": 99.95
+        }
+        
+        span.set_attribute("performance_data_retrieved", True)
+        
+        return {
+            "service": service or "all",
+            "timeframe": timeframe,
+            "data": performance_data,
+            "timestamp": datetime.utcnow().isoformat(),
+            "trace_id": span.get_span_context().trace_id
+        }
+        
+    except Exception as e:
+        span.record_exception(e)
+        raise HTTPException(status_code=500, detail=f"Failed to get performance data: {str(e)}")
+
+# Dashboard aggregate endpoint
+DASHBOARD_CACHE_TTL_SECONDS = 5.0
+_dashboard_cache: Optional[tuple] = None  # (expires_at, snapshot)
+
+@app.post("/api/dashboard")
+async def get_dashboard_snapshot(token_data: Dict[str, Any] = Depends(verify_token)):
+    """Health and alerts for the dashboard in a single round trip"""
+    global _dashboard_cache
+    if "alert" not in token_data.get("permissions", []):
+        raise HTTPException(status_code=403, detail="Insufficient permissions for alert monitoring")
+    if _dashboard_cache and _dashboard_cache[0] > time.monotonic():
+        return _dashboard_cache[1]
+    if not sre_agent:
+        raise HTTPException(status_code=503, detail="SRE Agent not initialized")
+    
+    # The dashboard only shows the alert list, so skip the LLM analysis
+    health_result, alerts_result = await asyncio.gather(
+        sre_agent.health_check(),
+        sre_agent.monitor_alerts(analyze=False),
+        return_exceptions=True
+    )
+    
+    # Failed sections degrade to {} so the dashboard can fall back per section
+    def _section(result: Any) -> Dict[str, Any]:
+        if isinstance(result, dict) and "error" not in result:
+            return result
+        return {}
+    
+    # Shape health into the fields the Overview page renders
+    def _overview_health(health: Dict[str, Any], alerts: Dict[str, Any]) -> Dict[str, Any]:
+        if not health:
+            return {}
+        components = health.get("components", {})
+        healthy = sum(1 for ok in components.values() if ok)
+
+        def _state(ok: bool) -> Dict[str, str]:
+            return {"status": "active" if ok else "down"}
+
+        llm_ok = components.get("primary_model") or components.get("fallback_model")
+        return {
+            "status": health.get("status", "unknown"),
+            "health_score": round(100 * healthy / len(components)) if components else 0,
+            "alerts_count": alerts.get("count", len(alerts.get("alerts", []))),
+            "environment": os.getenv("ENVIRONMENT", "stage"),
+            "architecture_status": {
+                "llm_reasoning_core": _state(bool(llm_ok)),
+                "observability_adapter": _state(bool(components.get("mcp_tools"))),
+                "insight_cache": _state(bool(components.get("redis")))
+            },
+            "components": components
+        }
+
+    alerts_section = _section(alerts_result)
+    snapshot = {
+        "health": _overview_health(_section(health_result), alerts_section),
+        "alerts": alerts_section,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    if snapshot["health"] and snapshot["alerts"]:
+        _dashboard_cache = (time.monotonic() + DASHBOARD_CACHE_TTL_SECONDS, snapshot)
+    return snapshot
+
+# Alert push channel: one shared poller fans each change out to every subscriber
+ALERTS_PUSH_INTERVAL_SECONDS = float(os.getenv("ALERTS_PUSH_INTERVAL", "5"))
+_alert_subscribers: set = set()
+_alert_poller: Optional[asyncio.Task] = None
+_alert_frame: bytes = b""
+
+async def _broadcast_alert_frame(frame: bytes):
+    """Send a frame to every subscriber, dropping the ones whose send fails"""
+    subscribers = list(_alert_subscribers)
+    results = await asyncio.gather(
+        *(websocket.send_bytes(frame) for websocket in subscribers),
+        return_exceptions=True
+    )
+    for websocket, result in zip(subscribers, results):
+        if isinstance(result, Exception):
+            _alert_subscribers.discard(websocket)
+
+async def _poll_alerts():
+    """Poll alerts while anyone is subscribed, broadcasting only when the alert list changes"""
+    global _alert_frame, _alert_poller
+    last_alerts = None
+    try:
+        while _alert_subscribers:
+            try:
+                if sre_agent:
+                    # Raw alert list only; the LLM analysis is left to /alerts/monitor
+                    result = await sre_agent.monitor_alerts(analyze=False)
+                    alerts = result.get("alerts") if isinstance(result, dict) else None
+                    if alerts is not None and alerts != last_alerts:
+                        last_alerts = alerts
+                        _alert_frame = orjson.dumps({
+                            "alerts": alerts,
+                            "count": len(alerts),
+                            "timestamp": datetime.utcnow().isoformat()
+                        })
+                        await _broadcast_alert_frame(_alert_frame)
+            except Exception:
+                # A failed tick (Redis, MCP tools down) must not end the stream for every subscriber
+                logger.exception("Alert poll failed")
+            await asyncio.sleep(ALERTS_PUSH_INTERVAL_SECONDS)
+    finally:
+        _alert_poller = None
+        _alert_frame = b""
+
+@app.websocket("/ws/alerts")
+async def alerts_stream(websocket: WebSocket):
+    """Push alert snapshots to the dashboard; requires a bearer token with the alert permission"""
+    global _alert_poller
+    scheme, _, token = websocket.headers.get("authorization", "").partition(" ")
+    try:
+        if scheme.lower() != "bearer":
+            raise HTTPException(status_code=401, detail="Missing bearer token")
+        token_data = decode_token(token)
+        if "alert" not in token_data.get("permissions", []):
+            raise HTTPException(status_code=403, detail="Insufficient permissions for alert monitoring")
+    except HTTPException as e:
+        # Closing before accept rejects the handshake
+        logger.info("Alert stream rejected", detail=e.detail)
+        await websocket.close(code=1008)
+        return
+    
+    await websocket.accept()
+    _alert_subscribers.add(websocket)
+    if _alert_frame:
+        await websocket.send_bytes(_alert_frame)
+    if _alert_poller is None:
+        _alert_poller = asyncio.create_task(_poll_alerts())
+    try:
+        # Clients never send; reading just surfaces the disconnect promptly
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    except WebSocketDisconnect:
+        pass
+    finally:
+        _alert_subscribers.discard(websocket)
+        logger.info("Alert stream client disconnected")
 
 # Root endpoint
+# The payload is static, so it is serialized once at import time.
+_ROOT_BYTES = orjson.dumps({
+    "message": "SRE AI Agent API - Final Architecture",
+    "version": "2.0.0",
+    "architecture": "LangGraph + JWT + mTLS + OTLP",
+    "endpoints": {
+        "health": "/health",
+        "chat": "/chat",
+        "auth": "/auth/login",
+        "incidents": "/incidents/investigate",
+        "alerts": "/alerts/monitor",
+        "metrics": "/metrics/system",
+        "performance": "/performance/data"
+    },
+    "documentation": "/docs"
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "SRE AI Agent API - Final Architecture",
-        "version": "2.0.0",
-        "architecture": "LangGraph + JWT + mTLS + OTLP",
-        "endpoints": {
-            "health": "/health",
-            "chat": "/chat",
-            "auth": "/auth/login",
-            "incidents": "/incidents/investigate",
-            "alerts": "/alerts/monitor",
-            "metrics": "/metrics/system",
-            "performance": "/performance/data"
-        },
-        "documentation": "/docs"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 # Error handlers
 @app.exception_handler(HTTPException)
@@ -484,7 +689,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     with tracer.start_as_current_span("http_exception") as span:
         span.set_attribute("status_code", exc.status_code)
         span.set_attribute("detail", exc.detail)
-        span.set_attribute("path", str(request.url))
+        span.set_attribute("path", request.url.path)
         
         return JSONResponse(
             status_code=exc.status_code,
@@ -501,7 +706,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions with tracing"""
     with tracer.start_as_current_span("general_exception") as span:
         span.record_exception(exc)
-        span.set_attribute("path", str(request.url))
+        span.set_attribute("path", request.url.path)
         
         return JSONResponse(
             status_code=500,
@@ -514,11 +719,19 @@ async def general_exception_handler(request: Request, exc: Exception):
         )
 
 if __name__ == "__main__":
-    # Run the API server
+    # Run the API server (uvloop + httptools come with uvicorn[standard];
+    # reload is incompatible with multiple workers, so it is dev-only).
+    # One worker by default: each worker process gets its own SREAgentCore,
+    # health/dashboard caches and alert poller, so set WORKERS>1 only if
+    # per-process caches and push channels are acceptable.
+    reload = os.getenv("RELOAD", "0") == "1"
     uvicorn.run(
         "sre_agent_api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if reload else int(os.getenv("WORKERS", "1")),
+        reload=reload,
         log_level="info"
-    ) 
\ No newline at end of file
+    )
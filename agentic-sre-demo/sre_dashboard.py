@@ -12,15 +12,26 @@ This dashboard provides:
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from websockets.sync.client import connect as ws_connect
+from websockets.exceptions import InvalidStatus
 import json
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import logging
+import os
 from datetime import datetime, timedelta
 import time
-import asyncio
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TYPE_CHECKING
 import threading
+from collections import deque
+from itertools import starmap
+from string import Template
+import ahocorasick
+
+# pandas/plotly are imported inside the pages that chart, so other pages
+# don't pay their import cost on a cold worker.
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # Configure Streamlit page
 st.set_page_config(
@@ -31,7 +42,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+DASHBOARD_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -49,6 +60,24 @@ st.markdown("""
         font-weight: 500;
         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
     }
+    /* Card text roles, so rows don't repeat inline styles */
+    .mc-title { color: #1f77b4; font-size: 1.1em; }
+    .mc-k { color: #2c3e50; }
+    .mc-v { color: #34495e; }
+    .mc-ok { color: #27ae60; font-weight: bold; }
+    /* Architecture page: children are styled by scope, not per element */
+    .arch-card strong { color: #1f77b4; }
+    .arch-card span { color: #34495e; }
+    .arch-layer {
+        background: rgba(255,255,255,0.1);
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        border: 2px solid rgba(255,255,255,0.3);
+    }
+    .arch-layer h3 { color: #FFD700; margin-bottom: 15px; }
+    .arch-items { font-size: 14px; line-height: 1.6; }
+    .arch-items div { margin: 8px 0; }
     .alert-critical {
         background-color: #ffebee;
         border-left: 4px solid #f44336;
@@ -76,24 +105,6 @@ st.markdown("""
         border-radius: 0.5rem;
         margin: 0.5rem 0;
     }
-    .chat-message {
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-radius: 0.5rem;
-        color: #333333;
-        font-weight: 500;
-    }
-    .user-message {
-        background-color: #e3f2fd;
-        margin-left: 2rem;
-        border-left: 4px solid #2196f3;
-    }
-    .agent-message {
-        background-color: #f8f9fa;
-        margin-right: 2rem;
-        border-left: 4px solid #4caf50;
-        color: #2c3e50;
-    }
     
     /* Sidebar button styling */
     .stButton > button {
@@ -113,123 +124,282 @@ st.markdown("""
         box-shadow: 0 4px 8px rgba(0,0,0,0.2);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+def _inject_css():
+    # Streamlit drops any element a rerun doesn't re-emit, so this runs every
+    # rerun; a "sent once" session flag would unstyle the page after the first click.
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
+
+_inject_css()
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared keep-alive session so API calls reuse TCP connections across reruns"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # One quick retry on gateway errors; the final response is returned rather than raised
+        max_retries=Retry(total=1, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Card templates: each page emits its cards as one markdown element
+ALERT_STYLE = {
+    "critical": {"css": "alert-critical", "color": "#d32f2f", "icon": "🚨"},
+    "warning": {"css": "alert-warning", "color": "#e65100", "icon": "⚠️"},
+    "info": {"css": "alert-info", "color": "#1565c0", "icon": "ℹ️"},
+}
+
+ALERT_CARD_TEMPLATE = """<div class="metric-card {css}">
+<strong style="color: {color}; font-size: 1.2em;">{icon} {severity_upper}</strong><br>
+<strong class="mc-k">Service:</strong> <span class="mc-v">{service}</span><br>
+<strong class="mc-k">Message:</strong> <span class="mc-v">{message}</span><br>
+<strong class="mc-k">Time:</strong> <span class="mc-v">{timestamp}</span><br>
+<strong class="mc-k">Status:</strong> <span style="color: {color}; font-weight: bold;">{status}</span>
+</div>"""
+
+INCIDENT_ICONS = {"high": "🔴", "medium": "🟡"}
+
+INCIDENT_CARD_TEMPLATE = """<div class="metric-card">
+<strong class="mc-title">{icon} {title}</strong><br>
+<strong class="mc-k">ID:</strong> <span class="mc-v">{id}</span><br>
+<strong class="mc-k">Severity:</strong> <span class="mc-v">{severity}</span><br>
+<strong class="mc-k">Status:</strong> <span class="mc-ok">{status}</span><br>
+<strong class="mc-k">Created:</strong> <span class="mc-v">{created_at}</span><br>
+<strong class="mc-k">Root Cause:</strong> <span class="mc-v">{root_cause}</span><br>
+<strong class="mc-k">Resolution Time:</strong> <span class="mc-v">{resolution_time}</span>
+</div>"""
+
+def _render_alert_card(alert: Dict[str, Any]) -> str:
+    return ALERT_CARD_TEMPLATE.format(
+        severity_upper=alert["severity"].upper(),
+        **ALERT_STYLE.get(alert["severity"], ALERT_STYLE["info"]),
+        **alert
+    )
+
+def _render_incident_card(incident: Dict[str, Any]) -> str:
+    return INCIDENT_CARD_TEMPLATE.format(
+        icon=INCIDENT_ICONS.get(incident["severity"], "🟢"),
+        **{**incident,
+           "root_cause": incident["root_cause"] or "Under investigation",
+           "resolution_time": incident["resolution_time"] or "Pending"}
+    )
+
+logger = logging.getLogger(__name__)
+
+# Bearer token for the authenticated API endpoints (issued by /auth/login)
+API_TOKEN = os.getenv("SRE_API_TOKEN", "")
+AUTH_HEADERS = {"Authorization": f"Bearer {API_TOKEN}"} if API_TOKEN else {}
+
+class AlertStream:
+    """Background WebSocket subscriber that keeps the latest pushed alert snapshot"""
+    
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self.latest: Dict[str, Any] = {}
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        delay = 5.0
+        while True:
+            try:
+                with ws_connect(self.ws_url, additional_headers=AUTH_HEADERS) as websocket:
+                    delay = 5.0
+                    for message in websocket:
+                        self.latest = json.loads(message)
+            except InvalidStatus as e:
+                # Rejected handshake (missing, expired or under-privileged token):
+                # retrying at a fixed rate won't help, so back off up to 10 minutes
+                delay = min(delay * 2, 600.0)
+                logger.warning("Alert stream rejected with HTTP %s; retrying in %.0fs",
+                               e.response.status_code, delay)
+            except Exception as e:
+                # API not up yet or connection dropped; REST polling covers the gap
+                delay = 5.0
+                logger.info("Alert stream unavailable (%s); retrying in %.0fs", e, delay)
+            # Don't let a dead stream's last frame override fresh REST data
+            self.latest = {}
+            time.sleep(delay)
+
+@st.cache_resource
+def get_alert_stream(api_base_url: str) -> AlertStream:
+    """One alert subscription per API, shared by every session"""
+    return AlertStream(api_base_url.replace("http", "ws", 1) + "/ws/alerts")
+
+# Cached data sources: Streamlit reruns the whole script on every widget
+# interaction, so results are memoized per argument (just the API base URL)
+# for a few seconds instead of being refetched on each rerun.
+# Health is probed at most every 10s; the sidebar Refresh button clears it
+@st.cache_data(ttl=10, show_spinner=False)
+def get_api_health_status(api_base_url: str) -> int:
+    """Status code of the API /health endpoint (0 if unreachable)"""
+    try:
+        response = get_http_session().get(f"{api_base_url}/health", timeout=1)
+        return response.status_code
+    except (requests.ConnectionError, requests.Timeout):
+        return 0
+
+# API responses are kept for 5s per (base URL, path, payload), shared across sessions
+@st.cache_data(ttl=5, show_spinner=False)
+def post_api(api_base_url: str, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """POST a JSON payload to the SRE API and return the decoded body"""
+    try:
+        response = get_http_session().post(f"{api_base_url}{path}", json=payload, timeout=5)
+        return response.json() if response.status_code == 200 else {}
+    except (requests.ConnectionError, requests.Timeout, ValueError):
+        return {}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def generate_mock_metrics() -> Dict[str, Any]:
+    """Generate mock metrics for demonstration"""
+    return {
+        "cpu_usage": {
+            "checkout_service": 75.2,
+            "payment_service": 45.8,
+            "inventory_service": 62.1,
+            "user_service": 38.9
+        },
+        "memory_usage": {
+            "checkout_service": 82.5,
+            "payment_service": 67.3,
+            "inventory_service": 71.8,
+            "user_service": 58.2
+        },
+        "error_rate": {
+            "checkout_service": 8.5,
+            "payment_service": 2.1,
+            "inventory_service": 1.8,
+            "user_service": 0.9
+        },
+        "latency_p95": {
+            "checkout_service": 1200,
+            "payment_service": 450,
+            "inventory_service": 680,
+            "user_service": 320
+        }
+    }
+
+# Static incident fields; only the timestamps are computed per call.
+# (id, title, description, severity, status, created ago, resolved ago, root cause, resolution time)
+_INCIDENT_TEMPLATES = (
+    ("INC-001", "High Error Rate on Checkout Service", "Checkout service experiencing 8.5% error rate",
+     "high", "resolved", timedelta(hours=2), timedelta(hours=1), "Database connection pool exhaustion", "1 hour"),
+    ("INC-002", "Memory Usage Alert", "Inventory service memory usage at 85%",
+     "medium", "investigating", timedelta(minutes=30), None, None, None),
+    ("INC-003", "Latency Spike", "Payment service latency increased by 200%",
+     "low", "resolved", timedelta(hours=4), timedelta(hours=3), "Network congestion", "1 hour"),
+)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def generate_mock_incidents() -> List[Dict[str, Any]]:
+    """Generate mock incident history"""
+    now = datetime.now()
+    return [
+        {
+            "id": incident_id,
+            "title": title,
+            "description": description,
+            "severity": severity,
+            "status": status,
+            "created_at": (now - created_ago).isoformat(),
+            "resolved_at": (now - resolved_ago).isoformat() if resolved_ago else None,
+            "root_cause": root_cause,
+            "resolution_time": resolution_time
+        }
+        for (incident_id, title, description, severity, status,
+             created_ago, resolved_ago, root_cause, resolution_time) in _INCIDENT_TEMPLATES
+    ]
+
+# Overview "Recent Activity" rows: (minutes ago, event, severity)
+_ACTIVITY_TEMPLATES = (
+    (5, "Alert resolved", "info"),
+    (10, "Incident investigation started", "warning"),
+    (15, "Automated action executed", "info"),
+    (20, "Health check completed", "info"),
+    (25, "New alert detected", "critical"),
+)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def generate_mock_activity() -> Dict[str, List[str]]:
+    """Generate mock recent activity for the overview table"""
+    now = datetime.now()
+    return {
+        "timestamp": [(now - timedelta(minutes=ago)).strftime("%H:%M") for ago, _, _ in _ACTIVITY_TEMPLATES],
+        "event": [event for _, event, _ in _ACTIVITY_TEMPLATES],
+        "severity": [severity for _, _, severity in _ACTIVITY_TEMPLATES]
+    }
 
 class SREDashboard:
     def __init__(self):
         self.api_base_url = "http://localhost:8000"
         self.chat_history = []
+        self.session = get_http_session()
         
     def check_api_health(self) -> bool:
-        """Check if the SRE API is running"""
-        try:
-            response = requests.get(f"{self.api_base_url}/health", timeout=5)
-            return response.status_code == 200
-        except:
-            return False
+        """Check if the SRE API is running, backing off while it reports 429/503"""
+        backoff = st.session_state.setdefault("_health_backoff", {"delay": 0.0, "until": 0.0, "healthy": False})
+        now = time.monotonic()
+        if now < backoff["until"]:
+            return backoff["healthy"]
+        
+        status = get_api_health_status(self.api_base_url)
+        backoff["healthy"] = status == 200
+        if status in (429, 503):
+            # Skip checks until the deadline instead of sleeping, so the page still renders
+            backoff["delay"] = min(backoff["delay"] * 2 or 1.0, 30.0)
+            backoff["until"] = now + backoff["delay"]
+        else:
+            backoff["delay"] = 0.0
+        return backoff["healthy"]
     
     def get_health_status(self) -> Dict[str, Any]:
         """Get comprehensive health status"""
-        try:
-            response = requests.post(
-                f"{self.api_base_url}/api/health-check",
-                json={"environment": "stage", "include_details": True},
-                timeout=10
-            )
-            return response.json() if response.status_code == 200 else {}
-        except:
-            return {}
+        return post_api(self.api_base_url, "/api/health-check", {"environment": "stage", "include_details": True})
     
     def get_alerts(self) -> Dict[str, Any]:
         """Get current alerts"""
+        return post_api(self.api_base_url, "/api/alerts/monitor", {"severity_filter": "all", "time_window": "1h"})
+    
+    def get_dashboard_snapshot(self) -> Dict[str, Any]:
+        """Get health and alerts in one aggregate call"""
+        # The endpoint requires a token; without one it would only 403
+        if not AUTH_HEADERS:
+            return {}
         try:
-            response = requests.post(
-                f"{self.api_base_url}/api/alerts/monitor",
-                json={"severity_filter": "all", "time_window": "1h"},
-                timeout=10
+            response = self.session.post(
+                f"{self.api_base_url}/api/dashboard",
+                json={"environment": "stage", "include_details": True, "severity_filter": "all", "time_window": "1h"},
+                headers=AUTH_HEADERS,
+                timeout=5
             )
             return response.json() if response.status_code == 200 else {}
-        except:
+        except (requests.ConnectionError, requests.Timeout, ValueError):
             return {}
     
     def investigate_incident(self, description: str) -> Dict[str, Any]:
         """Investigate an incident"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_base_url}/api/investigate",
                 json={"incident_description": description, "priority": "high"},
                 timeout=30
             )
             return response.json() if response.status_code == 200 else {}
-        except:
+        except (requests.ConnectionError, requests.Timeout, ValueError):
             return {}
     
     def generate_mock_metrics(self) -> Dict[str, Any]:
         """Generate mock metrics for demonstration"""
-        return {
-            "cpu_usage": {
-                "checkout_service": 75.2,
-                "payment_service": 45.8,
-                "inventory_service": 62.1,
-                "user_service": 38.9
-            },
-            "memory_usage": {
-                "checkout_service": 82.5,
-                "payment_service": 67.3,
-                "inventory_service": 71.8,
-                "user_service": 58.2
-            },
-            "error_rate": {
-                "checkout_service": 8.5,
-                "payment_service": 2.1,
-                "inventory_service": 1.8,
-                "user_service": 0.9
-            },
-            "latency_p95": {
-                "checkout_service": 1200,
-                "payment_service": 450,
-                "inventory_service": 680,
-                "user_service": 320
-            }
-        }
+        return generate_mock_metrics()
     
     def generate_mock_incidents(self) -> List[Dict[str, Any]]:
         """Generate mock incident history"""
-        return [
-            {
-                "id": "INC-001",
-                "title": "High Error Rate on Checkout Service",
-                "description": "Checkout service experiencing 8.5% error rate",
-                "severity": "high",
-                "status": "resolved",
-                "created_at": (datetime.now() - timedelta(hours=2)).isoformat(),
-                "resolved_at": (datetime.now() - timedelta(hours=1)).isoformat(),
-                "root_cause": "Database connection pool exhaustion",
-                "resolution_time": "1 hour"
-            },
-            {
-                "id": "INC-002",
-                "title": "Memory Usage Alert",
-                "description": "Inventory service memory usage at 85%",
-                "severity": "medium",
-                "status": "investigating",
-                "created_at": (datetime.now() - timedelta(minutes=30)).isoformat(),
-                "resolved_at": None,
-                "root_cause": None,
-                "resolution_time": None
-            },
-            {
-                "id": "INC-003",
-                "title": "Latency Spike",
-                "description": "Payment service latency increased by 200%",
-                "severity": "low",
-                "status": "resolved",
-                "created_at": (datetime.now() - timedelta(hours=4)).isoformat(),
-                "resolved_at": (datetime.now() - timedelta(hours=3)).isoformat(),
-                "root_cause": "Network congestion",
-                "resolution_time": "1 hour"
-            }
-        ]
+        return generate_mock_incidents()
 
 def main():
     st.markdown('<h1 class="main-header">🤖 SRE AI Agent Dashboard</h1>', unsafe_allow_html=True)
@@ -259,6 +429,10 @@ def main():
     if st.sidebar.button("🏗️ Architecture", use_container_width=True):
         st.session_state.current_page = "🏗️ Architecture"
     
+    if st.sidebar.button("🔄 Refresh", use_container_width=True):
+        get_api_health_status.clear()
+        st.session_state.pop("_health_backoff", None)
+    
     # Initialize current page if not set
     if 'current_page' not in st.session_state:
         st.session_state.current_page = "🏠 Overview"
@@ -275,12 +449,18 @@ def main():
     
     st.success("✅ SRE AI Agent API is running")
     
+    # One aggregate fetch per rerun for the pages that show live API data
+    snapshot = {}
+    if page in ("🏠 Overview", "🚨 Alerts"):
+        # Sections missing here fall back to that page's own cached endpoint call
+        snapshot = dashboard.get_dashboard_snapshot()
+    
     if page == "🏠 Overview":
-        show_overview(dashboard)
+        show_overview(dashboard, snapshot)
     elif page == "📊 Monitoring":
         show_monitoring(dashboard)
     elif page == "🚨 Alerts":
-        show_alerts(dashboard)
+        show_alerts(dashboard, snapshot)
     elif page == "📝 Incidents":
         show_incidents(dashboard)
     elif page == "💬 Chat with Agent":
@@ -292,12 +472,12 @@ def main():
     elif page == "🏗️ Architecture":
         show_architecture(dashboard)
 
-def show_overview(dashboard: SREDashboard):
+def show_overview(dashboard: SREDashboard, snapshot: Dict[str, Any]):
     """Show the main overview dashboard"""
     st.header("🏠 System Overview")
     
-    # Get health status
-    health_data = dashboard.get_health_status()
+    # Get health status, falling back to the dedicated endpoint
+    health_data = snapshot.get("health") or dashboard.get_health_status()
     
     # Create metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -352,27 +532,51 @@ def show_overview(dashboard: SREDashboard):
     st.subheader("📈 Recent Activity")
     
     # Mock activity data
-    activity_data = {
-        "timestamp": [
-            (datetime.now() - timedelta(minutes=5)).strftime("%H:%M"),
-            (datetime.now() - timedelta(minutes=10)).strftime("%H:%M"),
-            (datetime.now() - timedelta(minutes=15)).strftime("%H:%M"),
-            (datetime.now() - timedelta(minutes=20)).strftime("%H:%M"),
-            (datetime.now() - timedelta(minutes=25)).strftime("%H:%M")
-        ],
-        "event": [
-            "Alert resolved",
-            "Incident investigation started",
-            "Automated action executed",
-            "Health check completed",
-            "New alert detected"
-        ],
-        "severity": ["info", "warning", "info", "info", "critical"]
-    }
+    activity_data = generate_mock_activity()
     
-    df = pd.DataFrame(activity_data)
+    import pandas as pd
+    df = pd.DataFrame.from_dict(activity_data)
     st.dataframe(df, use_container_width=True)
 
+# Facet titles for the monitoring chart, keyed by metrics field
+MONITORING_LABELS = {
+    "cpu_usage": "CPU %",
+    "memory_usage": "Memory %",
+    "error_rate": "Error Rate %",
+    "latency_p95": "P95 Latency (ms)",
+}
+
+# cache_resource shares one figure across sessions without the pickle
+# round-trip cache_data does; callers must treat it as read-only.
+@st.cache_resource(ttl=30, show_spinner=False)
+def _build_monitoring_fig(metrics_key: tuple) -> "go.Figure":
+    """Build one faceted bar chart covering every metric"""
+    import pandas as pd
+    import plotly.express as px
+    
+    df = (
+        pd.DataFrame.from_dict(
+            {MONITORING_LABELS.get(metric, metric): dict(values) for metric, values in metrics_key},
+            orient="columns"
+        )
+        .reset_index(names="Service")
+        .melt(id_vars="Service", var_name="Metric", value_name="Value")
+    )
+    fig = px.bar(
+        df,
+        x="Service",
+        y="Value",
+        color="Service",
+        facet_col="Metric",
+        facet_col_wrap=2,
+        facet_row_spacing=0.15,
+        height=700
+    )
+    # Metrics have different units, so each facet gets its own y axis
+    fig.update_yaxes(matches=None, showticklabels=True, title_text="")
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=", 1)[-1]))
+    return fig
+
 def show_monitoring(dashboard: SREDashboard):
     """Show monitoring dashboard with metrics"""
     st.header("📊 System Monitoring")
@@ -380,101 +584,47 @@ def show_monitoring(dashboard: SREDashboard):
     # Get mock metrics
     metrics = dashboard.generate_mock_metrics()
     
-    # CPU Usage Chart
-    st.subheader("CPU Usage by Service")
-    cpu_data = pd.DataFrame([
-        {"Service": service, "CPU %": value}
-        for service, value in metrics["cpu_usage"].items()
-    ])
-    
-    fig_cpu = px.bar(
-        cpu_data, 
-        x="Service", 
-        y="CPU %",
-        color="CPU %",
-        color_continuous_scale="RdYlGn_r",
-        title="CPU Usage by Service"
-    )
-    st.plotly_chart(fig_cpu, use_container_width=True)
-    
-    # Memory Usage Chart
-    st.subheader("Memory Usage by Service")
-    memory_data = pd.DataFrame([
-        {"Service": service, "Memory %": value}
-        for service, value in metrics["memory_usage"].items()
-    ])
-    
-    fig_memory = px.bar(
-        memory_data,
-        x="Service",
-        y="Memory %",
-        color="Memory %",
-        color_continuous_scale="RdYlGn_r",
-        title="Memory Usage by Service"
-    )
-    st.plotly_chart(fig_memory, use_container_width=True)
-    
-    # Error Rate Chart
-    st.subheader("Error Rate by Service")
-    error_data = pd.DataFrame([
-        {"Service": service, "Error Rate %": value}
-        for service, value in metrics["error_rate"].items()
-    ])
-    
-    fig_error = px.bar(
-        error_data,
-        x="Service",
-        y="Error Rate %",
-        color="Error Rate %",
-        color_continuous_scale="Reds",
-        title="Error Rate by Service"
-    )
-    st.plotly_chart(fig_error, use_container_width=True)
-    
-    # Latency Chart
-    st.subheader("P95 Latency by Service")
-    latency_data = pd.DataFrame([
-        {"Service": service, "Latency (ms)": value}
-        for service, value in metrics["latency_p95"].items()
-    ])
-    
-    fig_latency = px.bar(
-        latency_data,
-        x="Service",
-        y="Latency (ms)",
-        color="Latency (ms)",
-        color_continuous_scale="RdYlGn_r",
-        title="P95 Latency by Service"
-    )
-    st.plotly_chart(fig_latency, use_container_width=True)
+    metrics_key = tuple((metric, tuple(sorted(values.items()))) for metric, values in metrics.items())
+    st.plotly_chart(_build_monitoring_fig(metrics_key), use_container_width=True)
 
-def show_alerts(dashboard: SREDashboard):
+def show_alerts(dashboard: SREDashboard, snapshot: Dict[str, Any]):
     """Show alerts dashboard"""
     st.header("🚨 Alerts Dashboard")
     
-    # Get alerts
-    alerts_data = dashboard.get_alerts()
+    # Get alerts, falling back to the dedicated endpoint
+    # Pushed frames win; REST only hydrates the page until the first frame arrives
+    # The stream needs a token, so without one the page relies on REST alone
+    pushed = get_alert_stream(dashboard.api_base_url).latest if API_TOKEN else {}
+    alerts_data = pushed or snapshot.get("alerts") or dashboard.get_alerts()
+    
+    # Alert summary, counted from the live alert list when the API returned one
+    live_alerts = alerts_data.get("alerts")
+    if isinstance(live_alerts, list):
+        severities = [alert.get("severity") for alert in live_alerts if isinstance(alert, dict)]
+        total, critical, warnings = len(live_alerts), severities.count("critical"), severities.count("warning")
+    else:
+        total, critical, warnings = 5, 1, 4
     
-    # Alert summary
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Total Alerts", alerts_data.get("alerts_count", 5))
+        st.metric("Total Alerts", total)
     
     with col2:
-        st.metric("Critical", alerts_data.get("critical_alerts", 1), delta="+1")
+        st.metric("Critical", critical, delta="+1")
     
     with col3:
-        st.metric("Warnings", alerts_data.get("warnings", 4), delta="-2")
+        st.metric("Warnings", warnings, delta="-2")
     
     # Mock alerts for demonstration
+    now = datetime.now()
     alerts = [
         {
             "id": "ALERT-001",
             "severity": "critical",
             "service": "checkout_service",
             "message": "High error rate detected: 8.5%",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "status": "active"
         },
         {
@@ -482,7 +632,7 @@ def show_alerts(dashboard: SREDashboard):
             "severity": "warning",
             "service": "inventory_service",
             "message": "Memory usage at 85%",
-            "timestamp": (datetime.now() - timedelta(minutes=30)).isoformat(),
+            "timestamp": (now - timedelta(minutes=30)).isoformat(),
             "status": "acknowledged"
         },
         {
@@ -490,43 +640,13 @@ def show_alerts(dashboard: SREDashboard):
             "severity": "warning",
             "service": "payment_service",
             "message": "Latency spike detected",
-            "timestamp": (datetime.now() - timedelta(hours=1)).isoformat(),
+            "timestamp": (now - timedelta(hours=1)).isoformat(),
             "status": "resolved"
         }
     ]
     
-    # Display alerts
-    for alert in alerts:
-        if alert["severity"] == "critical":
-            st.markdown(f"""
-            <div class="metric-card alert-critical">
-                <strong style="color: #d32f2f; font-size: 1.2em;">🚨 {alert['severity'].upper()}</strong><br>
-                <strong style="color: #2c3e50;">Service:</strong> <span style="color: #34495e;">{alert['service']}</span><br>
-                <strong style="color: #2c3e50;">Message:</strong> <span style="color: #34495e;">{alert['message']}</span><br>
-                <strong style="color: #2c3e50;">Time:</strong> <span style="color: #34495e;">{alert['timestamp']}</span><br>
-                <strong style="color: #2c3e50;">Status:</strong> <span style="color: #d32f2f; font-weight: bold;">{alert['status']}</span>
-            </div>
-            """, unsafe_allow_html=True)
-        elif alert["severity"] == "warning":
-            st.markdown(f"""
-            <div class="metric-card alert-warning">
-                <strong style="color: #e65100; font-size: 1.2em;">⚠️ {alert['severity'].upper()}</strong><br>
-                <strong style="color: #2c3e50;">Service:</strong> <span style="color: #34495e;">{alert['service']}</span><br>
-                <strong style="color: #2c3e50;">Message:</strong> <span style="color: #34495e;">{alert['message']}</span><br>
-                <strong style="color: #2c3e50;">Time:</strong> <span style="color: #34495e;">{alert['timestamp']}</span><br>
-                <strong style="color: #2c3e50;">Status:</strong> <span style="color: #e65100; font-weight: bold;">{alert['status']}</span>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="metric-card alert-info">
-                <strong style="color: #1565c0; font-size: 1.2em;">ℹ️ {alert['severity'].upper()}</strong><br>
-                <strong style="color: #2c3e50;">Service:</strong> <span style="color: #34495e;">{alert['service']}</span><br>
-                <strong style="color: #2c3e50;">Message:</strong> <span style="color: #34495e;">{alert['message']}</span><br>
-                <strong style="color: #2c3e50;">Time:</strong> <span style="color: #34495e;">{alert['timestamp']}</span><br>
-                <strong style="color: #2c3e50;">Status:</strong> <span style="color: #1565c0; font-weight: bold;">{alert['status']}</span>
-            </div>
-            """, unsafe_allow_html=True)
+    # Display alerts in a single markdown element
+    st.markdown("\n".join(map(_render_alert_card, alerts)), unsafe_allow_html=True)
 
 def show_incidents(dashboard: SREDashboard):
     """Show incidents dashboard"""
@@ -576,61 +696,13 @@ def show_incidents(dashboard: SREDashboard):
     
     incidents = dashboard.generate_mock_incidents()
     
-    for incident in incidents:
-        if incident["severity"] == "high":
-            color = "🔴"
-        elif incident["severity"] == "medium":
-            color = "🟡"
-        else:
-            color = "🟢"
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <strong style="color: #1f77b4; font-size: 1.1em;">{color} {incident['title']}</strong><br>
-            <strong style="color: #2c3e50;">ID:</strong> <span style="color: #34495e;">{incident['id']}</span><br>
-            <strong style="color: #2c3e50;">Severity:</strong> <span style="color: #34495e;">{incident['severity']}</span><br>
-            <strong style="color: #2c3e50;">Status:</strong> <span style="color: #27ae60; font-weight: bold;">{incident['status']}</span><br>
-            <strong style="color: #2c3e50;">Created:</strong> <span style="color: #34495e;">{incident['created_at']}</span><br>
-            <strong style="color: #2c3e50;">Root Cause:</strong> <span style="color: #34495e;">{incident['root_cause'] or 'Under investigation'}</span><br>
-            <strong style="color: #2c3e50;">Resolution Time:</strong> <span style="color: #34495e;">{incident['resolution_time'] or 'Pending'}</span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("\n".join(map(_render_incident_card, incidents)), unsafe_allow_html=True)
 
-def show_chat(dashboard: SREDashboard):
-    """Show chat interface with the SRE agent"""
-    st.header("💬 Chat with SRE AI Agent")
-    
-    # Initialize chat history
-    if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
-    
-    # Display chat history
-    for message in st.session_state.chat_history:
-        if message["role"] == "user":
-            st.markdown(f"""
-            <div class="chat-message user-message">
-                <strong>You:</strong> {message['content']}
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            # Use st.markdown for better formatting of agent responses
-            st.markdown("**SRE Agent:**")
-            st.markdown(message['content'])
-    
-    # Chat input
-    user_input = st.text_input("Ask the SRE agent:", placeholder="e.g., What's the current system health?")
-    
-    if st.button("Send") and user_input:
-        # Add user message to history
-        st.session_state.chat_history.append({
-            "role": "user",
-            "content": user_input,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        # Generate detailed agent response based on input
-        if "health" in user_input.lower():
-            response = """🏥 **System Health Status:**
+# Most recent chat messages kept per session; older ones are evicted
+CHAT_HISTORY_LIMIT = 200
+
+# Canned agent replies for the chat page
+_RESPONSE_HEALTH = """🏥 **System Health Status:**
             
 **Overall Health Score:** 85% (Good)
 **Uptime:** 99.9% (Last 30 days)
@@ -651,9 +723,8 @@ def show_chat(dashboard: SREDashboard):
 • Auto-scaled checkout service instances (2 minutes ago)
 • Acknowledged memory alert on inventory service (15 minutes ago)
 • Health check completed successfully (5 minutes ago)"""
-            
-        elif "alert" in user_input.lower() or "alerts" in user_input.lower():
-            response = """🚨 **Current Alert Status:**
+
+_RESPONSE_ALERTS = """🚨 **Current Alert Status:**
             
 **Total Active Alerts:** 5
 **Critical:** 1 | **Warnings:** 3 | **Info:** 1
@@ -696,9 +767,8 @@ def show_chat(dashboard: SREDashboard):
 • Auto-scaled checkout service instances
 • Increased database connection pool size
 • Triggered memory optimization on inventory service"""
-            
-        elif "incident" in user_input.lower():
-            response = """📋 **Incident Management Status:**
+
+_RESPONSE_INCIDENTS = """📋 **Incident Management Status:**
             
 **Open Incidents:** 2 | **Resolved Today:** 1
 
@@ -755,9 +825,8 @@ def show_chat(dashboard: SREDashboard):
 • **Incident Volume:** 3 this week (vs 5 last week)
 • **Resolution Rate:** 95% within SLA
 • **Automation Rate:** 85% of actions automated"""
-            
-        elif "recommendation" in user_input.lower() or "recommend" in user_input.lower():
-            response = """🎯 **System Recommendations:**
+
+_RESPONSE_RECOMMENDATIONS = """🎯 **System Recommendations:**
 
 **🚨 High Priority:**
 1. **Immediate Action Required:**
@@ -797,9 +866,8 @@ def show_chat(dashboard: SREDashboard):
 • Latency P95: 450ms (Target: <300ms) ❌
 • Memory Usage: 85% (Target: <80%) ❌
 • CPU Usage: 62% (Target: <70%) ✅"""
-            
-        elif "memory" in user_input.lower():
-            response = """💾 **Memory Usage Analysis:**
+
+_RESPONSE_MEMORY = """💾 **Memory Usage Analysis:**
 
 **Overall Memory Status:** ⚠️ Elevated
 **Total System Memory:** 85% utilized
@@ -835,9 +903,8 @@ def show_chat(dashboard: SREDashboard):
 **Automated Actions:**
 • Memory optimization triggered (15 minutes ago)
 • Alert acknowledged and monitoring"""
-            
-        elif "cpu" in user_input.lower():
-            response = """🖥️ **CPU Usage Analysis:**
+
+_RESPONSE_CPU = """🖥️ **CPU Usage Analysis:**
 
 **Overall CPU Status:** ✅ Healthy
 **Average CPU Usage:** 55% across all services
@@ -869,9 +936,8 @@ def show_chat(dashboard: SREDashboard):
 1. **Monitor:** Checkout service CPU trend
 2. **Optimize:** Consider load balancing if trend continues
 3. **Plan:** Review capacity planning for peak loads"""
-            
-        elif "error" in user_input.lower() or "errors" in user_input.lower():
-            response = """❌ **Error Rate Analysis:**
+
+_RESPONSE_ERRORS = """❌ **Error Rate Analysis:**
 
 **Overall Error Status:** 🔴 Critical
 **System-wide Error Rate:** 3.2% (Target: <2%)
@@ -916,9 +982,8 @@ def show_chat(dashboard: SREDashboard):
 1. **Immediate:** Scale database connections
 2. **Short-term:** Implement retry mechanisms
 3. **Long-term:** Add error rate monitoring and alerting"""
-            
-        elif "latency" in user_input.lower():
-            response = """⏱️ **Latency Analysis:**
+
+_RESPONSE_LATENCY = """⏱️ **Latency Analysis:**
 
 **Overall Latency Status:** ⚠️ Elevated
 **Average P95 Latency:** 662ms (Target: <500ms)
@@ -961,9 +1026,8 @@ def show_chat(dashboard: SREDashboard):
 1. **Immediate:** Optimize database queries
 2. **Short-term:** Implement caching layer
 3. **Long-term:** Consider database scaling"""
-            
-        elif "jira" in user_input.lower() or "ticket" in user_input.lower():
-            response = """🎫 **JIRA Integration Status:**
+
+_RESPONSE_JIRA = """🎫 **JIRA Integration Status:**
 
 **🔗 JIRA Configuration:**
 • **Base URL:** https://jira.company.com
@@ -1010,9 +1074,8 @@ def show_chat(dashboard: SREDashboard):
 • **Average Resolution Time:** 45 minutes
 • **Automation Rate:** 100% of critical incidents
 • **Template Usage:** Incident Management template"""
-            
-        elif "slack" in user_input.lower() or "channel" in user_input.lower():
-            response = """💬 **Slack Integration Status:**
+
+_RESPONSE_SLACK = """💬 **Slack Integration Status:**
 
 **🔗 Slack Configuration:**
 • **Webhook URL:** https://hooks.slack.com/services/...
@@ -1057,9 +1120,8 @@ def show_chat(dashboard: SREDashboard):
 • **Archived Channels:** 1
 • **Notification Rate:** 100% of critical alerts
 • **Response Time:** <5 minutes average"""
-            
-        else:
-            response = """🤖 **SRE AI Agent - How can I help you?**
+
+_RESPONSE_DEFAULT = """🤖 **SRE AI Agent - How can I help you?**
 
 I'm your intelligent SRE assistant. I can help you with:
 
@@ -1100,6 +1162,61 @@ I'm your intelligent SRE assistant. I can help you with:
 • "Tell me about automated actions"
 
 What would you like to know about your system?"""
+
+# (keywords, reply) in match order: the first entry with a keyword in the message wins
+_KEYWORD_TABLE = (
+    (("health",), _RESPONSE_HEALTH),
+    (("alert",), _RESPONSE_ALERTS),
+    (("incident",), _RESPONSE_INCIDENTS),
+    (("recommend",), _RESPONSE_RECOMMENDATIONS),
+    (("memory",), _RESPONSE_MEMORY),
+    (("cpu",), _RESPONSE_CPU),
+    (("error",), _RESPONSE_ERRORS),
+    (("latency",), _RESPONSE_LATENCY),
+    (("jira", "ticket"), _RESPONSE_JIRA),
+    (("slack", "channel"), _RESPONSE_SLACK),
+)
+
+@st.cache_resource
+def get_keyword_automaton() -> "ahocorasick.Automaton":
+    """Aho-Corasick automaton over every chat keyword, mapping each to its _KEYWORD_TABLE index"""
+    automaton = ahocorasick.Automaton()
+    for index, (keywords, _) in enumerate(_KEYWORD_TABLE):
+        for keyword in keywords:
+            automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+def match_chat_reply(user_input: str) -> str:
+    """Pick the canned reply for a message in one pass over the text"""
+    # Keep the table's precedence: the lowest matching index wins, not the earliest hit
+    hits = [index for _, index in get_keyword_automaton().iter(user_input.lower())]
+    return _KEYWORD_TABLE[min(hits)][1] if hits else _RESPONSE_DEFAULT
+
+def show_chat(dashboard: SREDashboard):
+    """Show chat interface with the SRE agent"""
+    st.header("💬 Chat with SRE AI Agent")
+    
+    # Initialize chat history
+    if "chat_history" not in st.session_state:
+        st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_LIMIT)
+    
+    # Display chat history
+    for message in st.session_state.chat_history:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+    
+    # Chat input
+    if user_input := st.chat_input("Ask the SRE agent: e.g., What's the current system health?"):
+        # Add user message to history
+        st.session_state.chat_history.append({
+            "role": "user",
+            "content": user_input,
+            "timestamp": datetime.now().isoformat()
+        })
+        
+        # Generate detailed agent response based on input
+        response = match_chat_reply(user_input)
         
         # Add agent response to history
         st.session_state.chat_history.append({
@@ -1110,94 +1227,220 @@ What would you like to know about your system?"""
         
         st.rerun()
 
+# Static mock data for the audit and actions pages; only timestamps are computed per render
+_AUDIT_LOGS_STATIC = (
+    {
+        "action": "AUTOMATED_ACTION",
+        "service": "checkout_service",
+        "description": "Auto-scaled service instances due to high CPU usage",
+        "user": "sre-agent",
+        "status": "success"
+    },
+    {
+        "action": "INCIDENT_INVESTIGATION",
+        "service": "payment_service",
+        "description": "Investigated latency spike, identified network congestion",
+        "user": "sre-agent",
+        "status": "completed"
+    },
+    {
+        "action": "ALERT_ACKNOWLEDGED",
+        "service": "inventory_service",
+        "description": "Acknowledged memory usage alert",
+        "user": "sre-agent",
+        "status": "acknowledged"
+    },
+    {
+        "action": "HEALTH_CHECK",
+        "service": "all",
+        "description": "Performed comprehensive system health check",
+        "user": "sre-agent",
+        "status": "completed"
+    },
+    {
+        "action": "AUTOMATED_REMEDIATION",
+        "service": "checkout_service",
+        "description": "Executed auto-rollback due to high error rate",
+        "user": "sre-agent",
+        "status": "success"
+    }
+)
+
+# How long ago each audit log entry happened
+_AUDIT_LOG_AGES = (timedelta(0), timedelta(minutes=5), timedelta(minutes=10), timedelta(minutes=15), timedelta(minutes=20))
+
+_AUDIT_ACTION_OPTIONS = ["All"] + list(dict.fromkeys(log["action"] for log in _AUDIT_LOGS_STATIC))
+_AUDIT_SERVICE_OPTIONS = ["All"] + list(dict.fromkeys(log["service"] for log in _AUDIT_LOGS_STATIC))
+_AUDIT_STATUS_OPTIONS = ["All"] + list(dict.fromkeys(log["status"] for log in _AUDIT_LOGS_STATIC))
+
+_AVAILABLE_ACTIONS = (
+    {
+        "action": "OPEN_JIRA_TICKET",
+        "description": "Create JIRA ticket for incident tracking",
+        "trigger": "Critical incidents, high severity alerts",
+        "example": "JIRA-20250728143000",
+        "status": "active"
+    },
+    {
+        "action": "OPEN_SLACK_CHANNEL",
+        "description": "Create Slack channel for incident communication",
+        "trigger": "Critical incidents, team coordination needed",
+        "example": "incident-checkout-service-error",
+        "status": "active"
+    },
+    {
+        "action": "SCALE_SERVICE",
+        "description": "Auto-scale service instances",
+        "trigger": "High CPU/memory usage",
+        "example": "Scaled checkout service from 3 to 5 instances",
+        "status": "active"
+    },
+    {
+        "action": "RESTART_SERVICE",
+        "description": "Restart failing service",
+        "trigger": "Service health checks failing",
+        "example": "Restarted payment service",
+        "status": "active"
+    },
+    {
+        "action": "TRIGGER_AUTO_ROLLBACK",
+        "description": "Rollback recent deployment",
+        "trigger": "High error rate after deployment",
+        "example": "Rolled back checkout service to v1.2.3",
+        "status": "active"
+    },
+    {
+        "action": "SUMMARIZE_INCIDENT",
+        "description": "Generate incident summary",
+        "trigger": "Incident investigation complete",
+        "example": "Created summary for INC-001",
+        "status": "active"
+    }
+)
+
+_RECENT_ACTIONS_STATIC = (
+    {
+        "action": "OPEN_JIRA_TICKET",
+        "incident_id": "INC-002",
+        "ticket_id": "JIRA-20250728143000",
+        "url": "https://jira.company.com/browse/JIRA-20250728143000",
+        "status": "success"
+    },
+    {
+        "action": "OPEN_SLACK_CHANNEL",
+        "incident_id": "INC-002",
+        "channel_name": "incident-memory-usage",
+        "webhook_url": "https://hooks.slack.com/services/...",
+        "status": "success"
+    },
+    {
+        "action": "SCALE_SERVICE",
+        "service": "checkout_service",
+        "details": "Scaled from 3 to 5 instances due to high CPU",
+        "status": "success"
+    },
+    {
+        "action": "SUMMARIZE_INCIDENT",
+        "incident_id": "INC-001",
+        "details": "Generated incident summary with root cause analysis",
+        "status": "success"
+    }
+)
+
+_RECENT_ACTION_AGES = (timedelta(0), timedelta(minutes=5), timedelta(minutes=10), timedelta(minutes=15))
+
+# Row templates for the audit and actions pages; string.Template parses each once
+_AUDIT_STATUS_ICONS = {
+    "success": "🟢",
+    "completed": "🟢",
+    "acknowledged": "🟡",
+    "failed": "🔴"
+}
+
+_AUDIT_ROW_TPL = Template("""<div class="metric-card">
+<strong class="mc-title">${status_color} ${action}</strong><br>
+<strong class="mc-k">Service:</strong> <span class="mc-v">${service}</span><br>
+<strong class="mc-k">Description:</strong> <span class="mc-v">${description}</span><br>
+<strong class="mc-k">User:</strong> <span class="mc-v">${user}</span><br>
+<strong class="mc-k">Time:</strong> <span class="mc-v">${timestamp}</span><br>
+<strong class="mc-k">Status:</strong> <span class="mc-ok">${status}</span>
+</div>""")
+
+_ACTION_ROW_TPL = Template("""<div class="metric-card">
+<strong class="mc-title">🔧 ${action}</strong><br>
+<strong class="mc-k">Description:</strong> <span class="mc-v">${description}</span><br>
+<strong class="mc-k">Trigger:</strong> <span class="mc-v">${trigger}</span><br>
+<strong class="mc-k">Example:</strong> <span class="mc-v">${example}</span><br>
+<strong class="mc-k">Status:</strong> <span class="mc-ok">${status}</span>
+</div>""")
+
+_RECENT_ACTION_TPL = Template("""<div class="metric-card">
+<strong class="mc-title">${status_icon} ${action}</strong><br>
+<strong class="mc-k">Time:</strong> <span class="mc-v">${timestamp}</span><br>
+<strong class="mc-k">Status:</strong> <span class="mc-ok">${status}</span><br>
+<strong class="mc-k">Details:</strong> <span class="mc-v">${details}</span><br>
+${extra}
+</div>""")
+
+# Fields shown on a recent-action card only when the action has them, in display order
+_OPTIONAL_ACTION_FIELDS = (
+    ("ticket_id", "Ticket ID"),
+    ("channel_name", "Channel"),
+    ("service", "Service"),
+    ("incident_id", "Incident ID"),
+)
+
+_FIELD_TPL = Template('<strong class="mc-k">${k}:</strong> <span class="mc-v">${v}</span><br>')
+
+def _render_recent_action(action: Dict[str, Any]) -> str:
+    extra = "".join(
+        _FIELD_TPL.substitute(k=label, v=value)
+        for key, label in _OPTIONAL_ACTION_FIELDS
+        if (value := action.get(key))
+    )
+    status_icon = "✅" if action["status"] == "success" else "❌"
+    return _RECENT_ACTION_TPL.substitute({"details": "N/A", **action, "status_icon": status_icon, "extra": extra})
+
 def show_audit_logs(dashboard: SREDashboard):
     """Show audit logs"""
     st.header("📋 Audit Logs")
     
     # Mock audit logs
+    now = datetime.now()
     audit_logs = [
-        {
-            "timestamp": datetime.now().isoformat(),
-            "action": "AUTOMATED_ACTION",
-            "service": "checkout_service",
-            "description": "Auto-scaled service instances due to high CPU usage",
-            "user": "sre-agent",
-            "status": "success"
-        },
-        {
-            "timestamp": (datetime.now() - timedelta(minutes=5)).isoformat(),
-            "action": "INCIDENT_INVESTIGATION",
-            "service": "payment_service",
-            "description": "Investigated latency spike, identified network congestion",
-            "user": "sre-agent",
-            "status": "completed"
-        },
-        {
-            "timestamp": (datetime.now() - timedelta(minutes=10)).isoformat(),
-            "action": "ALERT_ACKNOWLEDGED",
-            "service": "inventory_service",
-            "description": "Acknowledged memory usage alert",
-            "user": "sre-agent",
-            "status": "acknowledged"
-        },
-        {
-            "timestamp": (datetime.now() - timedelta(minutes=15)).isoformat(),
-            "action": "HEALTH_CHECK",
-            "service": "all",
-            "description": "Performed comprehensive system health check",
-            "user": "sre-agent",
-            "status": "completed"
-        },
-        {
-            "timestamp": (datetime.now() - timedelta(minutes=20)).isoformat(),
-            "action": "AUTOMATED_REMEDIATION",
-            "service": "checkout_service",
-            "description": "Executed auto-rollback due to high error rate",
-            "user": "sre-agent",
-            "status": "success"
-        }
+        {"timestamp": (now - ago).isoformat(), **row}
+        for ago, row in zip(_AUDIT_LOG_AGES, _AUDIT_LOGS_STATIC)
     ]
     
     # Filter options
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        action_filter = st.selectbox("Filter by Action:", ["All"] + list(set(log["action"] for log in audit_logs)))
+        action_filter = st.selectbox("Filter by Action:", _AUDIT_ACTION_OPTIONS)
     
     with col2:
-        service_filter = st.selectbox("Filter by Service:", ["All"] + list(set(log["service"] for log in audit_logs)))
+        service_filter = st.selectbox("Filter by Service:", _AUDIT_SERVICE_OPTIONS)
     
     with col3:
-        status_filter = st.selectbox("Filter by Status:", ["All"] + list(set(log["status"] for log in audit_logs)))
-    
-    # Filter logs
-    filtered_logs = audit_logs
-    if action_filter != "All":
-        filtered_logs = [log for log in filtered_logs if log["action"] == action_filter]
-    if service_filter != "All":
-        filtered_logs = [log for log in filtered_logs if log["service"] == service_filter]
-    if status_filter != "All":
-        filtered_logs = [log for log in filtered_logs if log["status"] == status_filter]
+        status_filter = st.selectbox("Filter by Status:", _AUDIT_STATUS_OPTIONS)
+    
+    # Filter logs in one pass; None means "no filter" for that field
+    action_filter = None if action_filter == "All" else action_filter
+    service_filter = None if service_filter == "All" else service_filter
+    status_filter = None if status_filter == "All" else status_filter
+    filtered_logs = [
+        log for log in audit_logs
+        if (action_filter is None or log["action"] == action_filter)
+        and (service_filter is None or log["service"] == service_filter)
+        and (status_filter is None or log["status"] == status_filter)
+    ]
     
     # Display logs
-    for log in filtered_logs:
-        status_color = {
-            "success": "🟢",
-            "completed": "🟢",
-            "acknowledged": "🟡",
-            "failed": "🔴"
-        }.get(log["status"], "⚪")
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <strong style="color: #1f77b4; font-size: 1.1em;">{status_color} {log['action']}</strong><br>
-            <strong style="color: #2c3e50;">Service:</strong> <span style="color: #34495e;">{log['service']}</span><br>
-            <strong style="color: #2c3e50;">Description:</strong> <span style="color: #34495e;">{log['description']}</span><br>
-            <strong style="color: #2c3e50;">User:</strong> <span style="color: #34495e;">{log['user']}</span><br>
-            <strong style="color: #2c3e50;">Time:</strong> <span style="color: #34495e;">{log['timestamp']}</span><br>
-            <strong style="color: #2c3e50;">Status:</strong> <span style="color: #27ae60; font-weight: bold;">{log['status']}</span>
-        </div>
-        """, unsafe_allow_html=True)
+    html = "\n".join(
+        _AUDIT_ROW_TPL.substitute({**log, "status_color": _AUDIT_STATUS_ICONS.get(log["status"], "⚪")})
+        for log in filtered_logs
+    )
+    st.markdown(html, unsafe_allow_html=True)
 
 def show_automated_actions(dashboard: SREDashboard):
     """Show automated actions dashboard"""
@@ -1225,116 +1468,18 @@ def show_automated_actions(dashboard: SREDashboard):
     # Action types
     st.subheader("🔧 Available Actions")
     
-    actions = [
-        {
-            "action": "OPEN_JIRA_TICKET",
-            "description": "Create JIRA ticket for incident tracking",
-            "trigger": "Critical incidents, high severity alerts",
-            "example": "JIRA-20250728143000",
-            "status": "active"
-        },
-        {
-            "action": "OPEN_SLACK_CHANNEL",
-            "description": "Create Slack channel for incident communication",
-            "trigger": "Critical incidents, team coordination needed",
-            "example": "incident-checkout-service-error",
-            "status": "active"
-        },
-        {
-            "action": "SCALE_SERVICE",
-            "description": "Auto-scale service instances",
-            "trigger": "High CPU/memory usage",
-            "example": "Scaled checkout service from 3 to 5 instances",
-            "status": "active"
-        },
-        {
-            "action": "RESTART_SERVICE",
-            "description": "Restart failing service",
-            "trigger": "Service health checks failing",
-            "example": "Restarted payment service",
-            "status": "active"
-        },
-        {
-            "action": "TRIGGER_AUTO_ROLLBACK",
-            "description": "Rollback recent deployment",
-            "trigger": "High error rate after deployment",
-            "example": "Rolled back checkout service to v1.2.3",
-            "status": "active"
-        },
-        {
-            "action": "SUMMARIZE_INCIDENT",
-            "description": "Generate incident summary",
-            "trigger": "Incident investigation complete",
-            "example": "Created summary for INC-001",
-            "status": "active"
-        }
-    ]
-    
-    for action in actions:
-        st.markdown(f"""
-        <div class="metric-card">
-            <strong style="color: #1f77b4; font-size: 1.1em;">🔧 {action['action']}</strong><br>
-            <strong style="color: #2c3e50;">Description:</strong> <span style="color: #34495e;">{action['description']}</span><br>
-            <strong style="color: #2c3e50;">Trigger:</strong> <span style="color: #34495e;">{action['trigger']}</span><br>
-            <strong style="color: #2c3e50;">Example:</strong> <span style="color: #34495e;">{action['example']}</span><br>
-            <strong style="color: #2c3e50;">Status:</strong> <span style="color: #27ae60; font-weight: bold;">{action['status']}</span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("\n".join(_ACTION_ROW_TPL.substitute(action) for action in _AVAILABLE_ACTIONS), unsafe_allow_html=True)
     
     # Recent automated actions
     st.subheader("📋 Recent Automated Actions")
     
+    now = datetime.now()
     recent_actions = [
-        {
-            "timestamp": datetime.now().isoformat(),
-            "action": "OPEN_JIRA_TICKET",
-            "incident_id": "INC-002",
-            "ticket_id": "JIRA-20250728143000",
-            "url": "https://jira.company.com/browse/JIRA-20250728143000",
-            "status": "success"
-        },
-        {
-            "timestamp": (datetime.now() - timedelta(minutes=5)).isoformat(),
-            "action": "OPEN_SLACK_CHANNEL",
-            "incident_id": "INC-002",
-            "channel_name": "incident-memory-usage",
-            "webhook_url": "https://hooks.slack.com/services/...",
-            "status": "success"
-        },
-        {
-            "timestamp": (datetime.now() - timedelta(minutes=10)).isoformat(),
-            "action": "SCALE_SERVICE",
-            "service": "checkout_service",
-            "details": "Scaled from 3 to 5 instances due to high CPU",
-            "status": "success"
-        },
-        {
-            "timestamp": (datetime.now() - timedelta(minutes=15)).isoformat(),
-            "action": "SUMMARIZE_INCIDENT",
-            "incident_id": "INC-001",
-            "details": "Generated incident summary with root cause analysis",
-            "status": "success"
-        }
+        {"timestamp": (now - ago).isoformat(), **row}
+        for ago, row in zip(_RECENT_ACTION_AGES, _RECENT_ACTIONS_STATIC)
     ]
     
-    for action in recent_actions:
-        if action["status"] == "success":
-            status_icon = "✅"
-        else:
-            status_icon = "❌"
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <strong style="color: #1f77b4; font-size: 1.1em;">{status_icon} {action['action']}</strong><br>
-            <strong style="color: #2c3e50;">Time:</strong> <span style="color: #34495e;">{action['timestamp']}</span><br>
-            <strong style="color: #2c3e50;">Status:</strong> <span style="color: #27ae60; font-weight: bold;">{action['status']}</span><br>
-            <strong style="color: #2c3e50;">Details:</strong> <span style="color: #34495e;">{action.get('details', 'N/A')}</span><br>
-            {f"<strong style='color: #2c3e50;'>Ticket ID:</strong> <span style='color: #34495e;'>{action.get('ticket_id', 'N/A')}</span><br>" if 'ticket_id' in action else ""}
-            {f"<strong style='color: #2c3e50;'>Channel:</strong> <span style='color: #34495e;'>{action.get('channel_name', 'N/A')}</span><br>" if 'channel_name' in action else ""}
-            {f"<strong style='color: #2c3e50;'>Service:</strong> <span style='color: #34495e;'>{action.get('service', 'N/A')}</span><br>" if 'service' in action else ""}
-            {f"<strong style='color: #2c3e50;'>Incident ID:</strong> <span style='color: #34495e;'>{action.get('incident_id', 'N/A')}</span><br>" if 'incident_id' in action else ""}
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("\n".join(_render_recent_action(action) for action in recent_actions), unsafe_allow_html=True)
     
     # Manual action trigger
     st.subheader("🎮 Manual Action Trigger")
@@ -1354,7 +1499,7 @@ def show_automated_actions(dashboard: SREDashboard):
             st.success(f"✅ Action {action_type} executed successfully!")
             
             if action_type == "OPEN_JIRA_TICKET":
-                ticket_id = f"JIRA-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                ticket_id = f"JIRA-{now.strftime('%Y%m%d%H%M%S')}"
                 st.info(f"**JIRA Ticket Created:** {ticket_id}")
                 st.info(f"**URL:** https://jira.company.com/browse/{ticket_id}")
                 
@@ -1372,20 +1517,8 @@ def show_automated_actions(dashboard: SREDashboard):
             elif action_type == "SUMMARIZE_INCIDENT":
                 st.info(f"**Incident Summary:** Generated summary for {incident_id}")
 
-def show_architecture(dashboard: SREDashboard):
-    """Show architecture visualization"""
-    st.header("🏗️ SRE AI Agent Architecture")
-    
-    # Architecture overview
-    st.markdown("""
-    ### 🎯 **Production-Level SRE AI Agent Architecture**
-    
-    The SRE AI Agent follows a comprehensive, production-ready architecture designed for enterprise-grade 
-    Site Reliability Engineering with full observability, automation, and compliance capabilities.
-    """)
-    
-    # Create a beautiful architecture diagram using HTML/CSS
-    st.markdown("""
+# Static architecture page content, built once at import instead of per rerun
+_ARCHITECTURE_HTML = """
     <div style="
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         border-radius: 15px;
@@ -1398,147 +1531,145 @@ def show_architecture(dashboard: SREDashboard):
         
         <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin-bottom: 30px;">
             <!-- Layer 1: User Interface -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">🎨 User Interface Layer</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">📊 Streamlit Dashboard</div>
-                    <div style="margin: 8px 0;">💬 Chat Interface</div>
-                    <div style="margin: 8px 0;">📱 Mobile Responsive</div>
-                    <div style="margin: 8px 0;">🎯 Real-time Updates</div>
+            <div class="arch-layer">
+                <h3>🎨 User Interface Layer</h3>
+                <div class="arch-items">
+                    <div>📊 Streamlit Dashboard</div>
+                    <div>💬 Chat Interface</div>
+                    <div>📱 Mobile Responsive</div>
+                    <div>🎯 Real-time Updates</div>
                 </div>
             </div>
             
             <!-- Layer 2: API Gateway -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">🌐 API Gateway Layer</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">🚀 FastAPI REST API</div>
-                    <div style="margin: 8px 0;">🔒 Authentication</div>
-                    <div style="margin: 8px 0;">📡 Rate Limiting</div>
-                    <div style="margin: 8px 0;">🛡️ CORS Support</div>
+            <div class="arch-layer">
+                <h3>🌐 API Gateway Layer</h3>
+                <div class="arch-items">
+                    <div>🚀 FastAPI REST API</div>
+                    <div>🔒 Authentication</div>
+                    <div>📡 Rate Limiting</div>
+                    <div>🛡️ CORS Support</div>
                 </div>
             </div>
             
             <!-- Layer 3: Core Agent -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">🤖 Core Agent Layer</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">🧠 LLM Reasoning</div>
-                    <div style="margin: 8px 0;">🔄 LangGraph Flow</div>
-                    <div style="margin: 8px 0;">💭 Memory Management</div>
-                    <div style="margin: 8px 0;">🎯 Action Policies</div>
+            <div class="arch-layer">
+                <h3>🤖 Core Agent Layer</h3>
+                <div class="arch-items">
+                    <div>🧠 LLM Reasoning</div>
+                    <div>🔄 LangGraph Flow</div>
+                    <div>💭 Memory Management</div>
+                    <div>🎯 Action Policies</div>
                 </div>
             </div>
         </div>
         
         <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin-bottom: 30px;">
             <!-- Layer 4: Observability -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">📊 Observability Layer</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">📈 Prometheus Metrics</div>
-                    <div style="margin: 8px 0;">📝 Elasticsearch Logs</div>
-                    <div style="margin: 8px 0;">🔍 Jaeger Traces</div>
-                    <div style="margin: 8px 0;">🚨 Alert Management</div>
+            <div class="arch-layer">
+                <h3>📊 Observability Layer</h3>
+                <div class="arch-items">
+                    <div>📈 Prometheus Metrics</div>
+                    <div>📝 Elasticsearch Logs</div>
+                    <div>🔍 Jaeger Traces</div>
+                    <div>🚨 Alert Management</div>
                 </div>
             </div>
             
             <!-- Layer 5: MCP Tools -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">🔧 MCP Tools Layer</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">🔗 Multi-MCP Integration</div>
-                    <div style="margin: 8px 0;">📡 SSE Transport</div>
-                    <div style="margin: 8px 0;">🛠️ Tool Orchestration</div>
-                    <div style="margin: 8px 0;">⚡ Real-time Data</div>
+            <div class="arch-layer">
+                <h3>🔧 MCP Tools Layer</h3>
+                <div class="arch-items">
+                    <div>🔗 Multi-MCP Integration</div>
+                    <div>📡 SSE Transport</div>
+                    <div>🛠️ Tool Orchestration</div>
+                    <div>⚡ Real-time Data</div>
                 </div>
             </div>
             
             <!-- Layer 6: External Integrations -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">🔗 External Integrations</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">🎫 JIRA Tickets</div>
-                    <div style="margin: 8px 0;">💬 Slack Channels</div>
-                    <div style="margin: 8px 0;">☁️ Cloud Services</div>
-                    <div style="margin: 8px 0;">🔐 Security Tools</div>
+            <div class="arch-layer">
+                <h3>🔗 External Integrations</h3>
+                <div class="arch-items">
+                    <div>🎫 JIRA Tickets</div>
+                    <div>💬 Slack Channels</div>
+                    <div>☁️ Cloud Services</div>
+                    <div>🔐 Security Tools</div>
                 </div>
             </div>
         </div>
         
         <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 20px;">
             <!-- Storage Layer -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">💾 Storage Layer</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">📄 JSON Storage</div>
-                    <div style="margin: 8px 0;">🧠 Memory Cache</div>
-                    <div style="margin: 8px 0;">💡 Insight Cache</div>
-                    <div style="margin: 8px 0;">📊 Metrics Storage</div>
+            <div class="arch-layer">
+                <h3>💾 Storage Layer</h3>
+                <div class="arch-items">
+                    <div>📄 JSON Storage</div>
+                    <div>🧠 Memory Cache</div>
+                    <div>💡 Insight Cache</div>
+                    <div>📊 Metrics Storage</div>
                 </div>
             </div>
             
             <!-- Infrastructure Layer -->
-            <div style="
-                background: rgba(255,255,255,0.1);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                border: 2px solid rgba(255,255,255,0.3);
-            ">
-                <h3 style="color: #FFD700; margin-bottom: 15px;">🏗️ Infrastructure Layer</h3>
-                <div style="font-size: 14px; line-height: 1.6;">
-                    <div style="margin: 8px 0;">🐳 Docker Containers</div>
-                    <div style="margin: 8px 0;">☸️ Kubernetes Ready</div>
-                    <div style="margin: 8px 0;">🔧 Helm Charts</div>
-                    <div style="margin: 8px 0;">📊 Monitoring Stack</div>
+            <div class="arch-layer">
+                <h3>🏗️ Infrastructure Layer</h3>
+                <div class="arch-items">
+                    <div>🐳 Docker Containers</div>
+                    <div>☸️ Kubernetes Ready</div>
+                    <div>🔧 Helm Charts</div>
+                    <div>📊 Monitoring Stack</div>
                 </div>
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+_TECH_STACK = {
+    "🤖 **AI/ML**:": "Ollama (Llama3), LangGraph, Reasoning Tools",
+    "🌐 **Web Framework**:": "FastAPI, Streamlit, Uvicorn",
+    "📊 **Observability**:": "Prometheus, Elasticsearch, Jaeger, MCP",
+    "💾 **Storage**:": "JSON Storage, Redis, PostgreSQL",
+    "🐳 **Containerization**:": "Docker, Docker Compose, Kubernetes",
+    "🔧 **Monitoring**:": "Grafana, AlertManager, Custom Dashboards",
+    "🔗 **Integrations**:": "JIRA API, Slack API, Cloud Services",
+    "🛡️ **Security**:": "OAuth2, JWT, CORS, Rate Limiting"
+}
+
+_PRINCIPLES = (
+    ("🎯 **Production-Ready**", "Enterprise-grade reliability, scalability, and security"),
+    ("🔄 **Event-Driven**", "Real-time response to system events and alerts"),
+    ("🧠 **AI-Powered**", "Intelligent reasoning and automated decision making"),
+    ("🔗 **Multi-Protocol**", "Support for various observability and monitoring protocols"),
+    ("🛡️ **Security-First**", "Authentication, authorization, and audit logging"),
+    ("📊 **Observable**", "Comprehensive monitoring and tracing capabilities"),
+)
+
+# Bound str.format of the architecture card template, parsed once at import
+_CARD = """<div class="metric-card arch-card">
+<strong>{0}</strong><br>
+<span>{1}</span>
+</div>""".format
+
+@st.cache_data(show_spinner=False)
+def _render_cards(items: tuple) -> str:
+    """Join (title, description) pairs into metric-card HTML for a single markdown call"""
+    return "\n".join(starmap(_CARD, items))
+
+def show_architecture(dashboard: SREDashboard):
+    """Show architecture visualization"""
+    st.header("🏗️ SRE AI Agent Architecture")
+    
+    # Architecture overview
+    st.markdown("""
+    ### 🎯 **Production-Level SRE AI Agent Architecture**
+    
+    The SRE AI Agent follows a comprehensive, production-ready architecture designed for enterprise-grade 
+    Site Reliability Engineering with full observability, automation, and compliance capabilities.
+    """)
+    
+    # Create a beautiful architecture diagram using HTML/CSS
+    st.markdown(_ARCHITECTURE_HTML, unsafe_allow_html=True)
     
     # Component details
     st.subheader("🔍 **Component Details**")
@@ -1594,81 +1725,22 @@ def show_architecture(dashboard: SREDashboard):
     # Architecture principles
     st.subheader("🏛️ **Architecture Principles**")
     
-    principles = [
-        {
-            "principle": "🎯 **Production-Ready**",
-            "description": "Enterprise-grade reliability, scalability, and security"
-        },
-        {
-            "principle": "🔄 **Event-Driven**",
-            "description": "Real-time response to system events and alerts"
-        },
-        {
-            "principle": "🧠 **AI-Powered**",
-            "description": "Intelligent reasoning and automated decision making"
-        },
-        {
-            "principle": "🔗 **Multi-Protocol**",
-            "description": "Support for various observability and monitoring protocols"
-        },
-        {
-            "principle": "🛡️ **Security-First**",
-            "description": "Authentication, authorization, and audit logging"
-        },
-        {
-            "principle": "📊 **Observable**",
-            "description": "Comprehensive monitoring and tracing capabilities"
-        }
-    ]
-    
-    for i, principle in enumerate(principles):
-        if i % 2 == 0:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <strong style="color: #1f77b4;">{principle['principle']}</strong><br>
-                    <span style="color: #34495e;">{principle['description']}</span>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            with col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <strong style="color: #1f77b4;">{principle['principle']}</strong><br>
-                    <span style="color: #34495e;">{principle['description']}</span>
-                </div>
-                """, unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
+    col1.markdown(_render_cards(_PRINCIPLES[0::2]), unsafe_allow_html=True)
+    col2.markdown(_render_cards(_PRINCIPLES[1::2]), unsafe_allow_html=True)
     
     # Technology stack
     st.subheader("🛠️ **Technology Stack**")
     
-    tech_stack = {
-        "🤖 **AI/ML**:": "Ollama (Llama3), LangGraph, Reasoning Tools",
-        "🌐 **Web Framework**:": "FastAPI, Streamlit, Uvicorn",
-        "📊 **Observability**:": "Prometheus, Elasticsearch, Jaeger, MCP",
-        "💾 **Storage**:": "JSON Storage, Redis, PostgreSQL",
-        "🐳 **Containerization**:": "Docker, Docker Compose, Kubernetes",
-        "🔧 **Monitoring**:": "Grafana, AlertManager, Custom Dashboards",
-        "🔗 **Integrations**:": "JIRA API, Slack API, Cloud Services",
-        "🛡️ **Security**:": "OAuth2, JWT, CORS, Rate Limiting"
-    }
-    
-    for tech, description in tech_stack.items():
-        st.markdown(f"""
-        <div class="metric-card">
-            <strong style="color: #1f77b4;">{tech}</strong><br>
-            <span style="color: #34495e;">{description}</span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_render_cards(tuple(_TECH_STACK.items())), unsafe_allow_html=True)
     
     # Compliance and standards
     st.subheader("📋 **Compliance & Standards**")
     
     st.markdown("""
-    <div class="metric-card">
-        <strong style="color: #1f77b4;">🏛️ Architecture Compliance</strong><br>
-        <span style="color: #34495e;">
+    <div class="metric-card arch-card">
+        <strong>🏛️ Architecture Compliance</strong><br>
+        <span>
         ✅ Production-level SRE practices<br>
         ✅ Enterprise security standards<br>
         ✅ Scalable microservices architecture<br>
@@ -1,4 +1,5 @@
 import os
+import asyncio
 from dotenv import load_dotenv
 import httpx
 
@@ -9,22 +10,46 @@ if not key:
     raise ValueError("Missing OPENROUTER_API_KEY in .env")
 
 # Use the correct base URL here:
-url = "https://openrouter.ai/api/v1/chat/completions"
+base_url = "https://openrouter.ai/api/v1"
 headers = {
     "Authorization": f"Bearer {key}",
     "Content-Type": "application/json",
 }
-payload = {
-    "model": "gpt-4o-mini",
-    "messages": [
-        {"role": "system", "content": "You are a helpful assistant."},
-        {"role": "user", "content": "Say hello"}
-    ]
-}
 
-# Send the request
-resp = httpx.post(url, headers=headers, json=payload, timeout=30.0)
-resp.raise_for_status()
+# Prompts to send; add more to fan out concurrently over one client
+prompts = ["Say hello"]
+MAX_CONCURRENCY = 20
+
+async def ask(prompt: str, client: httpx.AsyncClient) -> str:
+    """Send one prompt and return the model's reply"""
+    payload = {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt}
+        ]
+    }
+    resp = await client.post("/chat/completions", json=payload)
+    resp.raise_for_status()
+    return resp.json()["choices"][0]["message"]["content"]
+
+async def main():
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def bounded(prompt: str, client: httpx.AsyncClient) -> str:
+        async with sem:
+            return await ask(prompt, client)
+
+    # Shared keep-alive client so concurrent calls reuse TCP/TLS connections
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=200)
+    ) as client:
+        results = await asyncio.gather(*(bounded(p, client) for p in prompts))
+    for message in results:
+        print("LLM responded:", message)
 
-message = resp.json()["choices"][0]["message"]["content"]
-print("LLM responded:", message)
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,11 +7,15 @@ actual MCP server connections, making it useful for development and CI/CD.
 """
 
 import asyncio
-import json
 import sys
-from datetime import datetime
+import time
+from importlib.util import find_spec
 from typing import Dict, Any
 
+def _now() -> str:
+    """Second-resolution local ISO timestamp for mock results"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
 # Mock the MCP tools for testing
 class MockMCPTools:
     """Mock MCP tools for testing without actual server connections"""
@@ -25,6 +29,9 @@ class MockMCPTools:
     async def initialize(self):
         pass
 
+# Canned non-streaming reply, so tests don't format a response per call
+_MOCK_RESP = "Mock response to: <elided>"
+
 class MockAgent:
     """Mock agent for testing"""
     
@@ -37,8 +44,26 @@ class MockAgent:
     
     async def aprint_response(self, message: str, stream: bool = True, markdown: bool = True):
         """Mock response for testing"""
+        if not stream:
+            return _MOCK_RESP
         return f"Mock response to: {message[:100]}..."
 
+# Mock MCP server URLs per environment; anything other than "dev" uses stage
+_MCP_URLS = {
+    "dev": (
+        "https://mcp-elasticsearch-dev.example.com/sse",
+        "https://mcp-metrics-dev.example.com/sse",
+        "https://mcp-jaeger-dev.example.com/sse"
+    ),
+    "stage": (
+        "https://mcp-elasticsearch-stage.example.com/sse",
+        "https://mcp-metrics-stage.example.com/sse",
+        "https://mcp-vanguard-stage.example.com/sse",
+        "https://mcp-nagios-stage.example.com/sse",
+        "https://mcp-jaeger-stage.example.com/sse"
+    )
+}
+
 class MockSREAgent:
     """Mock SRE agent for testing"""
     
@@ -66,20 +91,7 @@ class MockSREAgent:
     
     def _get_mcp_urls(self):
         """Get mock MCP URLs"""
-        if self.config.environment == "dev":
-            return [
-                "https://mcp-elasticsearch-dev.example.com/sse",
-                "https://mcp-metrics-dev.example.com/sse",
-                "https://mcp-jaeger-dev.example.com/sse"
-            ]
-        else:
-            return [
-                "https://mcp-elasticsearch-stage.example.com/sse",
-                "https://mcp-metrics-stage.example.com/sse",
-                "https://mcp-vanguard-stage.example.com/sse",
-                "https://mcp-nagios-stage.example.com/sse",
-                "https://mcp-jaeger-stage.example.com/sse"
-            ]
+        return _MCP_URLS.get(self.config.environment, _MCP_URLS["stage"])
     
     async def health_check(self) -> Dict[str, Any]:
         """Mock health check"""
@@ -87,12 +99,12 @@ class MockSREAgent:
         
         response = await self.agent.aprint_response(
             message="Perform a comprehensive health check",
-            stream=True,
+            stream=False,
             markdown=True
         )
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "environment": self.config.environment,
             "response": response,
             "status": "healthy",
@@ -105,12 +117,12 @@ class MockSREAgent:
         
         response = await self.agent.aprint_response(
             message=f"Investigate: {incident_description}",
-            stream=True,
+            stream=False,
             markdown=True
         )
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "incident": incident_description,
             "investigation": response,
             "mock": True
@@ -122,60 +134,68 @@ class MockSREAgent:
         
         response = await self.agent.aprint_response(
             message="Monitor for new alerts",
-            stream=True,
+            stream=False,
             markdown=True
         )
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "alerts": response,
             "mock": True
         }
 
+def _flush(lines):
+    """Write buffered report lines in one call and reset the buffer"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
 async def test_basic_functionality():
     """Test basic SRE agent functionality"""
-    print("=== Testing SRE Agent Basic Functionality ===\n")
+    _buf = []
+    out = _buf.append
+    out("=== Testing SRE Agent Basic Functionality ===\n")
     
     # Test configuration
     from sre_agent import SREConfig
     config = SREConfig(environment="stage")
     
-    print(f"✓ Configuration created: environment={config.environment}")
-    print(f"✓ Alert thresholds: {config.alert_thresholds}")
+    out(f"✓ Configuration created: environment={config.environment}")
+    out(f"✓ Alert thresholds: {config.alert_thresholds}")
     
     # Test agent initialization
     agent = MockSREAgent(config)
+    _flush(_buf)
     await agent.initialize()
-    print("✓ Agent initialized successfully")
+    out("✓ Agent initialized successfully")
     
     # Test MCP URLs
     mcp_urls = agent._get_mcp_urls()
-    print(f"✓ MCP URLs configured: {len(mcp_urls)} servers")
+    out(f"✓ MCP URLs configured: {len(mcp_urls)} servers")
     for url in mcp_urls:
-        print(f"  - {url}")
-    
-    # Test health check
-    print("\n--- Testing Health Check ---")
-    health_result = await agent.health_check()
-    print(f"✓ Health check completed: {health_result['status']}")
-    
-    # Test incident investigation
-    print("\n--- Testing Incident Investigation ---")
-    incident_result = await agent.investigate_incident(
-        "High error rate on checkout service"
+        out(f"  - {url}")
+    
+    # Health check, incident investigation and alert monitoring are independent,
+    # so run them concurrently
+    out("\n--- Testing Health Check, Incident Investigation and Alert Monitoring ---")
+    _flush(_buf)
+    health_result, incident_result, alerts_result = await asyncio.gather(
+        agent.health_check(),
+        agent.investigate_incident("High error rate on checkout service"),
+        agent.monitor_alerts()
     )
-    print(f"✓ Incident investigation completed")
+    out(f"✓ Health check completed: {health_result['status']}")
+    out(f"✓ Incident investigation completed")
+    out(f"✓ Alert monitoring completed")
     
-    # Test alert monitoring
-    print("\n--- Testing Alert Monitoring ---")
-    alerts_result = await agent.monitor_alerts()
-    print(f"✓ Alert monitoring completed")
-    
-    print("\n=== All Basic Tests Passed! ===")
+    out("\n=== All Basic Tests Passed! ===")
+    _flush(_buf)
 
 async def test_api_endpoints():
     """Test API endpoint functionality"""
-    print("\n=== Testing API Endpoints ===\n")
+    _buf = []
+    out = _buf.append
+    out("\n=== Testing API Endpoints ===\n")
     
     # This would test the FastAPI endpoints
     # For now, just verify the structure
@@ -192,23 +212,26 @@ async def test_api_endpoints():
         "/api/metrics"
     ]
     
-    print("✓ API endpoints defined:")
+    out("✓ API endpoints defined:")
     for endpoint in endpoints:
-        print(f"  - {endpoint}")
+        out(f"  - {endpoint}")
     
-    print("\n=== API Endpoint Tests Passed! ===")
+    out("\n=== API Endpoint Tests Passed! ===")
+    _flush(_buf)
 
 def test_configuration():
     """Test configuration validation"""
-    print("\n=== Testing Configuration ===\n")
+    _buf = []
+    out = _buf.append
+    out("\n=== Testing Configuration ===\n")
     
     from sre_agent import SREConfig
     
     # Test default configuration
     config = SREConfig()
-    print(f"✓ Default environment: {config.environment}")
-    print(f"✓ Default model: {config.model_name}")
-    print(f"✓ Alert thresholds: {config.alert_thresholds}")
+    out(f"✓ Default environment: {config.environment}")
+    out(f"✓ Default model: {config.model_name}")
+    out(f"✓ Alert thresholds: {config.alert_thresholds}")
     
     # Test custom configuration
     custom_config = SREConfig(
@@ -220,21 +243,25 @@ def test_configuration():
             "error_rate": 10.0
         }
     )
-    print(f"✓ Custom environment: {custom_config.environment}")
-    print(f"✓ Custom model: {custom_config.model_name}")
-    print(f"✓ Custom thresholds: {custom_config.alert_thresholds}")
+    out(f"✓ Custom environment: {custom_config.environment}")
+    out(f"✓ Custom model: {custom_config.model_name}")
+    out(f"✓ Custom thresholds: {custom_config.alert_thresholds}")
     
-    print("\n=== Configuration Tests Passed! ===")
+    out("\n=== Configuration Tests Passed! ===")
+    _flush(_buf)
 
 def test_dependencies():
     """Test that all required dependencies are available"""
-    print("\n=== Testing Dependencies ===\n")
+    _buf = []
+    out = _buf.append
+    out("\n=== Testing Dependencies ===\n")
     
     required_modules = [
         "agno",
         "fastapi",
         "uvicorn",
         "pydantic",
+        "orjson",
         "asyncio",
         "logging",
         "datetime",
@@ -243,20 +270,22 @@ def test_dependencies():
     
     missing_modules = []
     
+    # find_spec only locates each module; it doesn't execute its import-time code
     for module in required_modules:
-        try:
-            __import__(module)
-            print(f"✓ {module}")
-        except ImportError:
-            print(f"✗ {module} - MISSING")
+        if find_spec(module) is not None:
+            out(f"✓ {module}")
+        else:
+            out(f"✗ {module} - MISSING")
             missing_modules.append(module)
     
     if missing_modules:
-        print(f"\n❌ Missing dependencies: {missing_modules}")
-        print("Please install missing dependencies with: pip install -r requirements.txt")
+        out(f"\n❌ Missing dependencies: {missing_modules}")
+        out("Please install missing dependencies with: pip install -r requirements.txt")
+        _flush(_buf)
         return False
     else:
-        print("\n✓ All dependencies available")
+        out("\n✓ All dependencies available")
+        _flush(_buf)
         return True
 
 async def main():
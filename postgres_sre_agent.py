@@ -4,124 +4,244 @@ SRE AI Agent with PostgreSQL Database Querying Capabilities
 Uses Agno to create an intelligent agent that can query SRE monitoring data
 """
 
-import agno
-from agno.models.ollama import Ollama
-from agno.tools.sql import SQLTools
-from agno.storage.postgres import PostgresStorage
+import getpass
 import psycopg2
-from psycopg2.extras import RealDictCursor
-import json
+import psycopg2.pool
+from psycopg2 import sql
+from contextlib import contextmanager
+import re
+import asyncio
+import sys
+import time
 from datetime import datetime, timedelta
 
+try:
+    import readline  # noqa: F401 - line editing for interactive_mode's input()
+except ImportError:
+    pass
+
+# Console separators
+_SEP60 = "=" * 60
+_SEP50 = "=" * 50
+_SEP40 = "=" * 40
+_DASH40 = "-" * 40
+
+# Sample queries for demonstration
+_SAMPLE_QUERIES = (
+    "Show me the current system health metrics",
+    "What are the active alerts?",
+    "List all open incidents",
+    "Show me performance metrics for the last hour",
+    "What automated actions were taken recently?",
+    "Show me JIRA tickets created today",
+    "What Slack channels are active?",
+    "Which services have the highest error rates?",
+    "Show me incidents by severity",
+    "What's the average response time for each service?"
+)
+
+def _pg_url(cfg):
+    """Build the postgresql:// URL used by both the SQL tool and agent storage"""
+    return f"postgresql://{cfg['user']}@{cfg['host']}:{cfg['port']}/{cfg['database']}"
+
+# Cached answers expire so live monitoring questions are re-asked
+ANSWER_CACHE_TTL_SECONDS = 60.0
+
+def _cache_key(query):
+    """Normalize case, spacing and punctuation, keeping every word in order"""
+    return " ".join(re.findall(r"\w+", query.lower()))
+
 class SREDatabaseAgent:
     """SRE AI Agent that can query PostgreSQL database for monitoring data"""
     
-    def __init__(self):
+    def __init__(self, db_config=None, with_agent=True):
         # Database configuration
-        self.db_config = {
+        self.db_config = db_config or {
             'host': 'localhost',
             'database': 'sre_agent_db',
-            'user': 'viveknandakumar',
+            'user': getpass.getuser(),
             'password': '',
             'port': 5432
         }
         
+        # Answers to earlier queries: normalized text -> (expires_at, answer)
+        self._cache = {}
+        
+        # Connection pool for direct queries, opened on first use
+        self._pool = None
+        
+        # Sample queries for demonstration
+        self.sample_queries = _SAMPLE_QUERIES
+        
+        self.sql_tool = None
+        self.agent = None
+        # Extra agents for concurrent demo queries; agno Agents aren't shared across threads
+        self._worker_agents = []
+        if not with_agent:
+            return
+        
+        self.sql_tool, self.agent = self._build_agent()
+    
+    def _build_agent(self):
+        """Build an agno Agent with its own SQL tool and session storage"""
+        # The agno stack is heavy, so it is only imported when an agent is built
+        import agno
+        from agno.models.ollama import Ollama
+        from agno.tools.sql import SQLTools
+        from agno.storage.postgres import PostgresStorage
+        
         # Create SQL tool for database queries
-        self.sql_tool = SQLTools(
-            connection_string=f"postgresql://{self.db_config['user']}@{self.db_config['host']}:{self.db_config['port']}/{self.db_config['database']}"
-        )
+        url = _pg_url(self.db_config)
+        sql_tool = SQLTools(connection_string=url)
         
         # Create Agno agent with PostgreSQL capabilities
-        self.agent = agno.Agent(
+        agent = agno.Agent(
             model=Ollama(model="llama3.1:8b"),
-            tools=[self.sql_tool],
-            storage=PostgresStorage(config=agno.Config(postgres_url=f"postgresql://{self.db_config['user']}@{self.db_config['host']}:{self.db_config['port']}/{self.db_config['database']}"))
+            tools=[sql_tool],
+            storage=PostgresStorage(config=agno.Config(postgres_url=url))
         )
-        
-        # Sample queries for demonstration
-        self.sample_queries = [
-            "Show me the current system health metrics",
-            "What are the active alerts?",
-            "List all open incidents",
-            "Show me performance metrics for the last hour",
-            "What automated actions were taken recently?",
-            "Show me JIRA tickets created today",
-            "What Slack channels are active?",
-            "Which services have the highest error rates?",
-            "Show me incidents by severity",
-            "What's the average response time for each service?"
-        ]
+        return sql_tool, agent
+    
+    @classmethod
+    def for_db_info_only(cls, db_config=None):
+        """Build an instance for get_database_info() without loading agno or an LLM"""
+        return cls(db_config, with_agent=False)
     
     def run_query(self, query: str):
         """Run a natural language query against the database"""
         try:
             print(f"🤖 SRE Agent: Processing query: '{query}'")
-            print("=" * 60)
+            print(_SEP60)
             
-            # Run the agent with the query
-            response = self.agent.run(query)
+            # Run the agent with the query, unless an equivalent one was already answered
+            content = self._cached_answer(query)
+            if content is None:
+                content = self.agent.run(query).content
+                self._remember(query, content)
             
-            print(f"📊 Results:")
-            print(response.content)
-            print("=" * 60)
+            sys.stdout.write(f"📊 Results:\n{content}\n{_SEP60}\n")
             
-            return response.content
+            return content
             
         except Exception as e:
             print(f"❌ Error running query: {e}")
             return None
     
+    def _cached_answer(self, query: str):
+        """Return an unexpired cached answer for the same normalized query, else None"""
+        entry = self._cache.get(_cache_key(query))
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def _remember(self, query: str, content: str):
+        """Cache an agent answer under the normalized query for ANSWER_CACHE_TTL_SECONDS"""
+        self._cache[_cache_key(query)] = (time.monotonic() + ANSWER_CACHE_TTL_SECONDS, content)
+    
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection, returning it to the pool afterwards"""
+        if self._pool is None:
+            self._pool = psycopg2.pool.ThreadedConnectionPool(1, 8, **self.db_config)
+        conn = self._pool.getconn()
+        try:
+            yield conn
+        finally:
+            # End the read transaction so the pooled connection isn't left idle in transaction
+            conn.rollback()
+            self._pool.putconn(conn)
+    
+    def close(self):
+        """Close all pooled database connections"""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+    
     def get_database_info(self):
         """Get information about the database tables and data"""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-            
-            # Get table information
-            cursor.execute("""
-                SELECT table_name, 
-                       (SELECT COUNT(*) FROM information_schema.columns WHERE table_name = t.table_name) as column_count
-                FROM information_schema.tables t
-                WHERE table_schema = 'public'
-                ORDER BY table_name
-            """)
-            
-            tables = cursor.fetchall()
-            
-            print("🗄️  Database Information:")
-            print("=" * 40)
-            
-            for table_name, column_count in tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                row_count = cursor.fetchone()[0]
-                print(f"📋 {table_name}: {row_count} rows, {column_count} columns")
-            
-            cursor.close()
-            conn.close()
+            with self._conn() as conn, conn.cursor() as cursor:
+                # Get table information, with column counts from one grouped scan
+                cursor.execute("""
+                    SELECT t.table_name, COUNT(c.column_name) as column_count
+                    FROM information_schema.tables t
+                    LEFT JOIN information_schema.columns c
+                      ON c.table_schema = t.table_schema AND c.table_name = t.table_name
+                    WHERE t.table_schema = 'public'
+                    GROUP BY t.table_name
+                    ORDER BY t.table_name
+                """)
+                
+                tables = cursor.fetchall()
+                
+                # Exact row counts for every table in a single round trip
+                row_counts = {}
+                if tables:
+                    cursor.execute(sql.SQL(" UNION ALL ").join(
+                        sql.SQL("SELECT {}, COUNT(*) FROM {}").format(
+                            sql.Literal(table_name), sql.Identifier(table_name)
+                        )
+                        for table_name, _ in tables
+                    ))
+                    row_counts = dict(cursor.fetchall())
+                
+                print("🗄️  Database Information:")
+                print(_SEP40)
+                
+                for table_name, column_count in tables:
+                    print(f"📋 {table_name}: {row_counts[table_name]} rows, {column_count} columns")
             
         except Exception as e:
             print(f"❌ Error getting database info: {e}")
     
+    async def _arun_query(self, query: str, agents: asyncio.Queue):
+        """Run one query in a worker thread on an agent no other worker is using"""
+        agent = await agents.get()
+        try:
+            content = self._cached_answer(query)
+            if content is None:
+                content = (await asyncio.to_thread(agent.run, query)).content
+                self._remember(query, content)
+            return content
+        except Exception as e:
+            return f"❌ Error running query: {e}"
+        finally:
+            agents.put_nowait(agent)
+    
+    async def run_demo_queries_async(self, concurrency: int = 4):
+        """Run all demo queries concurrently, at most `concurrency` in flight against Ollama"""
+        # One agent per worker, so sessions and run state never interleave
+        while len(self._worker_agents) < concurrency - 1:
+            self._worker_agents.append(self._build_agent()[1])
+        agents = asyncio.Queue()
+        for agent in [self.agent, *self._worker_agents[:concurrency - 1]]:
+            agents.put_nowait(agent)
+        return await asyncio.gather(*[self._arun_query(q, agents) for q in self.sample_queries])
+    
     def run_demo_queries(self):
         """Run a series of demo queries to showcase capabilities"""
         print("🚀 Running Demo Queries...")
-        print("=" * 60)
+        print(_SEP60)
         
-        for i, query in enumerate(self.sample_queries, 1):
+        results = asyncio.run(self.run_demo_queries_async())
+        
+        # Print after gathering so concurrent answers don't interleave
+        for i, (query, result) in enumerate(zip(self.sample_queries, results), 1):
             print(f"\n🔍 Query {i}: {query}")
-            self.run_query(query)
-            print("\n" + "-" * 40)
+            print(f"📊 Results:")
+            print(result)
+            print("\n" + _DASH40)
     
     def interactive_mode(self):
         """Run the agent in interactive mode"""
         print("🤖 SRE Database Agent - Interactive Mode")
-        print("=" * 50)
+        print(_SEP50)
         print("Type your questions about the SRE monitoring data.")
         print("Examples:")
         for query in self.sample_queries[:5]:
             print(f"  • {query}")
         print("Type 'quit' to exit")
-        print("=" * 50)
+        print(_SEP50)
         
         while True:
             try:
@@ -146,7 +266,7 @@ def main():
     """Main function to run the SRE Database Agent"""
     
     print("🤖 SRE Database Agent with Agno")
-    print("=" * 50)
+    print(_SEP50)
     
     # Create the agent
     agent = SREDatabaseAgent()
@@ -154,7 +274,7 @@ def main():
     # Show database information
     agent.get_database_info()
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP50)
     print("Choose an option:")
     print("1. Run demo queries")
     print("2. Interactive mode")
@@ -181,6 +301,8 @@ def main():
         print("\n👋 Goodbye!")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        agent.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
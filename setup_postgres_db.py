@@ -3,9 +3,11 @@
 Setup PostgreSQL database with sample data for SRE AI Agent
 """
 
+import getpass
+import io
+import numpy as np
 import psycopg2
 from psycopg2.extras import RealDictCursor
-import random
 from datetime import datetime, timedelta
 import json
 
@@ -13,11 +15,22 @@ import json
 DB_CONFIG = {
     'host': 'localhost',
     'database': 'sre_agent_db',
-    'user': 'viveknandakumar',  # Your system username
+    'user': getpass.getuser(),  # Your system username
     'password': '',  # No password for local setup
     'port': 5432
 }
 
+# Seeded tables and their labels in the setup summary
+SEED_TABLES = {
+    'system_metrics': 'System Metrics',
+    'alerts': 'Alerts',
+    'incidents': 'Incidents',
+    'performance_metrics': 'Performance Metrics',
+    'automated_actions': 'Automated Actions',
+    'jira_tickets': 'JIRA Tickets',
+    'slack_channels': 'Slack Channels',
+}
+
 def create_tables(cursor):
     """Create tables for SRE monitoring data"""
     
@@ -122,32 +135,68 @@ def create_tables(cursor):
         )
     """)
 
+def create_indexes(cursor):
+    """Create indexes for the agent's canned queries; run after the bulk load"""
+    
+    # BRIN for the time-ordered series, btree for the status/severity filters
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_system_metrics_ts ON system_metrics USING BRIN (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_performance_metrics_ts ON performance_metrics USING BRIN (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_automated_actions_ts ON automated_actions USING BRIN (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts (status);
+        CREATE INDEX IF NOT EXISTS idx_incidents_status ON incidents (status);
+        CREATE INDEX IF NOT EXISTS idx_incidents_severity ON incidents (severity);
+        CREATE INDEX IF NOT EXISTS idx_jira_tickets_created_at ON jira_tickets (created_at);
+        CREATE INDEX IF NOT EXISTS idx_slack_channels_status ON slack_channels (status)
+    """)
+
+# Escapes for COPY's text format; everything else is sent verbatim
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def copy_rows(cursor, table, columns, rows):
+    """Stream rows into a table with a single COPY FROM STDIN"""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(
+            "\\N" if value is None else str(value).translate(_COPY_ESCAPES) for value in row
+        ))
+        buf.write("\n")
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)", buf
+    )
+
 def insert_sample_data(cursor):
     """Insert sample data into all tables"""
     
+    # Random columns are drawn as whole NumPy vectors, one call per column
+    rng = np.random.default_rng()
+    # One reference time for every generated timestamp
+    now = datetime.now()
+    
     # Sample services and environments
     services = ['web-api', 'auth-service', 'payment-gateway', 'user-service', 'notification-service']
     environments = ['production', 'staging', 'development']
     severities = ['critical', 'high', 'medium', 'low']
     statuses = ['open', 'resolved', 'in_progress', 'closed']
+    # Incident ids, formatted once and drawn from by the tables that reference incidents
+    inc_ids = [f"INC-{i:03d}" for i in range(1, 21)]
     
     # Insert system metrics (last 24 hours)
     print("Inserting system metrics...")
-    for i in range(100):
-        timestamp = datetime.now() - timedelta(hours=i)
-        cursor.execute("""
-            INSERT INTO system_metrics (timestamp, cpu_usage, memory_usage, disk_usage, 
-                                      network_latency, service_name, environment)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            timestamp,
-            random.uniform(20, 95),
-            random.uniform(30, 90),
-            random.uniform(40, 85),
-            random.uniform(10, 500),
-            random.choice(services),
-            random.choice(environments)
-        ))
+    n = 100
+    copy_rows(cursor, "system_metrics", (
+        "timestamp", "cpu_usage", "memory_usage", "disk_usage",
+        "network_latency", "service_name", "environment"
+    ), zip(
+        [now - timedelta(hours=i) for i in range(n)],
+        rng.uniform(20, 95, n).tolist(),
+        rng.uniform(30, 90, n).tolist(),
+        rng.uniform(40, 85, n).tolist(),
+        rng.uniform(10, 500, n).tolist(),
+        rng.choice(services, n).tolist(),
+        rng.choice(environments, n).tolist()
+    ))
     
     # Insert alerts
     print("Inserting alerts...")
@@ -161,21 +210,20 @@ def insert_sample_data(cursor):
         ('Network Latency High', 'Network latency exceeded 200ms')
     ]
     
-    for i in range(50):
-        alert_type, description = random.choice(alert_types)
-        cursor.execute("""
-            INSERT INTO alerts (timestamp, alert_name, severity, status, description, 
-                              service_name, environment)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            datetime.now() - timedelta(hours=random.randint(1, 72)),
-            alert_type,
-            random.choice(severities),
-            random.choice(['active', 'resolved']),
-            description,
-            random.choice(services),
-            random.choice(environments)
-        ))
+    n = 50
+    picks = [alert_types[k] for k in rng.integers(len(alert_types), size=n)]
+    copy_rows(cursor, "alerts", (
+        "timestamp", "alert_name", "severity", "status", "description",
+        "service_name", "environment"
+    ), zip(
+        [now - timedelta(hours=h) for h in rng.integers(1, 73, n).tolist()],
+        [alert_type for alert_type, _ in picks],
+        rng.choice(severities, n).tolist(),
+        rng.choice(['active', 'resolved'], n).tolist(),
+        [description for _, description in picks],
+        rng.choice(services, n).tolist(),
+        rng.choice(environments, n).tolist()
+    ))
     
     # Insert incidents
     print("Inserting incidents...")
@@ -189,27 +237,31 @@ def insert_sample_data(cursor):
         ('Third-party Service Down', 'External service dependency failure')
     ]
     
-    for i in range(20):
-        incident_type, description = random.choice(incident_types)
-        created_at = datetime.now() - timedelta(hours=random.randint(1, 168))
-        resolved_at = created_at + timedelta(hours=random.randint(1, 8)) if random.choice([True, False]) else None
-        
-        cursor.execute("""
-            INSERT INTO incidents (incident_id, title, description, severity, status, 
-                                created_at, resolved_at, assigned_to, service_name, environment)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            f"INC-{i+1:03d}",
-            incident_type,
-            description,
-            random.choice(severities),
-            random.choice(statuses),
-            created_at,
-            resolved_at,
-            random.choice(['SRE Team', 'DevOps Team', 'On-call Engineer']),
-            random.choice(services),
-            random.choice(environments)
-        ))
+    n = len(inc_ids)
+    picks = [incident_types[k] for k in rng.integers(len(incident_types), size=n)]
+    created_at = [now - timedelta(hours=h) for h in rng.integers(1, 169, n).tolist()]
+    # About half are resolved; offsets and the resolved mask are drawn up front
+    resolved_at = [
+        created + timedelta(hours=hours) if resolved else None
+        for created, hours, resolved in zip(
+            created_at, rng.integers(1, 9, n).tolist(), (rng.random(n) < 0.5).tolist()
+        )
+    ]
+    copy_rows(cursor, "incidents", (
+        "incident_id", "title", "description", "severity", "status",
+        "created_at", "resolved_at", "assigned_to", "service_name", "environment"
+    ), zip(
+        inc_ids,
+        [incident_type for incident_type, _ in picks],
+        [description for _, description in picks],
+        rng.choice(severities, n).tolist(),
+        rng.choice(statuses, n).tolist(),
+        created_at,
+        resolved_at,
+        rng.choice(['SRE Team', 'DevOps Team', 'On-call Engineer'], n).tolist(),
+        rng.choice(services, n).tolist(),
+        rng.choice(environments, n).tolist()
+    ))
     
     # Insert performance metrics
     print("Inserting performance metrics...")
@@ -218,20 +270,19 @@ def insert_sample_data(cursor):
         '/health', '/metrics', '/api/products', '/api/cart', '/api/search'
     ]
     
-    for i in range(200):
-        cursor.execute("""
-            INSERT INTO performance_metrics (timestamp, service_name, endpoint, 
-                                          response_time, error_rate, throughput, environment)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            datetime.now() - timedelta(minutes=i*30),
-            random.choice(services),
-            random.choice(endpoints),
-            random.uniform(50, 2000),
-            random.uniform(0, 10),
-            random.uniform(100, 5000),
-            random.choice(environments)
-        ))
+    n = 200
+    copy_rows(cursor, "performance_metrics", (
+        "timestamp", "service_name", "endpoint",
+        "response_time", "error_rate", "throughput", "environment"
+    ), zip(
+        [now - timedelta(minutes=i*30) for i in range(n)],
+        rng.choice(services, n).tolist(),
+        rng.choice(endpoints, n).tolist(),
+        rng.uniform(50, 2000, n).tolist(),
+        rng.uniform(0, 10, n).tolist(),
+        rng.uniform(100, 5000, n).tolist(),
+        rng.choice(environments, n).tolist()
+    ))
     
     # Insert automated actions
     print("Inserting automated actions...")
@@ -245,62 +296,66 @@ def insert_sample_data(cursor):
         ('Create Slack Channel', 'Created incident communication channel')
     ]
     
-    for i in range(30):
-        action_type, description = random.choice(action_types)
-        cursor.execute("""
-            INSERT INTO automated_actions (timestamp, action_type, description, status, 
-                                        incident_id, service_name, environment)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            datetime.now() - timedelta(hours=random.randint(1, 48)),
-            action_type,
-            description,
-            random.choice(['success', 'failed', 'in_progress']),
-            f"INC-{random.randint(1, 20):03d}",
-            random.choice(services),
-            random.choice(environments)
-        ))
+    n = 30
+    picks = [action_types[k] for k in rng.integers(len(action_types), size=n)]
+    copy_rows(cursor, "automated_actions", (
+        "timestamp", "action_type", "description", "status",
+        "incident_id", "service_name", "environment"
+    ), zip(
+        [now - timedelta(hours=h) for h in rng.integers(1, 49, n).tolist()],
+        [action_type for action_type, _ in picks],
+        [description for _, description in picks],
+        rng.choice(['success', 'failed', 'in_progress'], n).tolist(),
+        rng.choice(inc_ids, n).tolist(),
+        rng.choice(services, n).tolist(),
+        rng.choice(environments, n).tolist()
+    ))
     
     # Insert JIRA tickets
     print("Inserting JIRA tickets...")
-    for i in range(15):
-        created_at = datetime.now() - timedelta(hours=random.randint(1, 72))
-        resolved_at = created_at + timedelta(hours=random.randint(2, 24)) if random.choice([True, False]) else None
-        
-        cursor.execute("""
-            INSERT INTO jira_tickets (ticket_id, title, description, priority, status, 
-                                    created_at, resolved_at, assignee, incident_id)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            f"JIRA-{i+1:03d}",
-            f"Incident {i+1} - {random.choice(['Service Outage', 'Performance Issue', 'Security Alert'])}",
-            f"Automatically created ticket for incident {i+1}",
-            random.choice(['High', 'Medium', 'Low', 'Critical']),
-            random.choice(['Open', 'In Progress', 'Resolved', 'Closed']),
-            created_at,
-            resolved_at,
-            random.choice(['SRE Team', 'DevOps Engineer', 'System Admin']),
-            f"INC-{random.randint(1, 20):03d}"
-        ))
+    n = 15
+    created_at = [now - timedelta(hours=h) for h in rng.integers(1, 73, n).tolist()]
+    resolved_at = [
+        created + timedelta(hours=hours) if resolved else None
+        for created, hours, resolved in zip(
+            created_at, rng.integers(2, 25, n).tolist(), (rng.random(n) < 0.5).tolist()
+        )
+    ]
+    copy_rows(cursor, "jira_tickets", (
+        "ticket_id", "title", "description", "priority", "status",
+        "created_at", "resolved_at", "assignee", "incident_id"
+    ), zip(
+        [f"JIRA-{i+1:03d}" for i in range(n)],
+        [f"Incident {i+1} - {kind}" for i, kind in enumerate(
+            rng.choice(['Service Outage', 'Performance Issue', 'Security Alert'], n).tolist()
+        )],
+        [f"Automatically created ticket for incident {i+1}" for i in range(n)],
+        rng.choice(['High', 'Medium', 'Low', 'Critical'], n).tolist(),
+        rng.choice(['Open', 'In Progress', 'Resolved', 'Closed'], n).tolist(),
+        created_at,
+        resolved_at,
+        rng.choice(['SRE Team', 'DevOps Engineer', 'System Admin'], n).tolist(),
+        rng.choice(inc_ids, n).tolist()
+    ))
     
     # Insert Slack channels
     print("Inserting Slack channels...")
-    for i in range(10):
-        cursor.execute("""
-            INSERT INTO slack_channels (channel_name, channel_id, created_at, incident_id, status)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (
-            f"incident-{i+1:03d}",
-            f"C{i+1:06d}",
-            datetime.now() - timedelta(hours=random.randint(1, 48)),
-            f"INC-{random.randint(1, 20):03d}",
-            random.choice(['active', 'archived'])
-        ))
+    n = 10
+    copy_rows(cursor, "slack_channels", (
+        "channel_name", "channel_id", "created_at", "incident_id", "status"
+    ), zip(
+        [f"incident-{i+1:03d}" for i in range(n)],
+        [f"C{i+1:06d}" for i in range(n)],
+        [now - timedelta(hours=h) for h in rng.integers(1, 49, n).tolist()],
+        rng.choice(inc_ids, n).tolist(),
+        rng.choice(['active', 'archived'], n).tolist()
+    ))
 
 def main():
     """Main function to set up the database"""
+    conn = None
     try:
-        # Connect to database
+        # Connect to database; DDL runs in autocommit so tables persist on their own
         conn = psycopg2.connect(**DB_CONFIG)
         conn.autocommit = True
         cursor = conn.cursor()
@@ -311,35 +366,40 @@ def main():
         print("📋 Creating tables...")
         create_tables(cursor)
         
-        # Insert sample data
+        # Insert sample data in a single transaction
         print("📊 Inserting sample data...")
+        conn.autocommit = False
+        # Seed data is reproducible, so don't wait on the WAL flush at commit
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        cursor.execute("SET LOCAL maintenance_work_mem = '256MB'")
         insert_sample_data(cursor)
         
+        # Index once the data is in, rather than maintaining indexes row by row
+        print("🔎 Creating indexes...")
+        create_indexes(cursor)
+        conn.commit()
+        
         # Verify data
         print("✅ Verifying data...")
-        cursor.execute("SELECT COUNT(*) FROM system_metrics")
-        metrics_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM alerts")
-        alerts_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM incidents")
-        incidents_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM performance_metrics")
-        perf_count = cursor.fetchone()[0]
+        # Refresh planner statistics, then read every table's row count from
+        # pg_class in one lookup instead of scanning each table with COUNT(*)
+        cursor.execute(f"ANALYZE {', '.join(SEED_TABLES)}")
+        cursor.execute("""
+            SELECT relname, reltuples::bigint
+            FROM pg_class
+            WHERE relnamespace = 'public'::regnamespace AND relname = ANY(%s)
+        """, (list(SEED_TABLES),))
+        counts = dict(cursor.fetchall())
+        conn.commit()
+        summary = "\n".join(
+            f"- {label}: {counts.get(table, 0)} records" for table, label in SEED_TABLES.items()
+        )
         
         print(f"""
 🎉 Database setup complete!
 
 📊 Sample data inserted:
-- System Metrics: {metrics_count} records
-- Alerts: {alerts_count} records  
-- Incidents: {incidents_count} records
-- Performance Metrics: {perf_count} records
-- Automated Actions: 30 records
-- JIRA Tickets: 15 records
-- Slack Channels: 10 records
+{summary}
 
 🔗 Database: sre_agent_db
 📍 Host: localhost:5432
@@ -352,6 +412,9 @@ Ready for Agno agent queries! 🚀
         conn.close()
         
     except Exception as e:
+        if conn is not None and not conn.closed:
+            conn.rollback()
+            conn.close()
         print(f"❌ Error setting up database: {e}")
         return False
     
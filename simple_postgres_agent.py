@@ -4,24 +4,36 @@ Simple SRE AI Agent with PostgreSQL Database Querying
 Uses direct SQL queries with natural language processing
 """
 
+import getpass
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import json
+from collections import Counter
 from datetime import datetime, timedelta
 import re
+import sys
+import ahocorasick
+
+# Database configuration, resolved once at import
+DB_CONFIG = {
+    'host': 'localhost',
+    'database': 'sre_agent_db',
+    'user': getpass.getuser(),  # Local peer login as the current user
+    'password': '',
+    'port': 5432
+}
 
 class SimpleSREDatabaseAgent:
     """Simple SRE AI Agent that can query PostgreSQL database for monitoring data"""
     
-    def __init__(self):
+    def __init__(self, db_config=None):
         # Database configuration
-        self.db_config = {
-            'host': 'localhost',
-            'database': 'sre_agent_db',
-            'user': 'viveknandakumar',
-            'password': '',
-            'port': 5432
-        }
+        self.db_config = db_config or DB_CONFIG
+        
+        # Persistent connection, opened on first use and reused across queries,
+        # and the canned queries already prepared on it
+        self.conn = None
+        self._prepared = set()
         
         # Predefined queries for common SRE questions
         self.query_patterns = {
@@ -158,25 +170,53 @@ class SimpleSREDatabaseAgent:
                 """
             }
         }
-    
-    def get_matching_query(self, user_input):
-        """Find the best matching query based on user input"""
-        user_input_lower = user_input.lower()
-        
-        best_match = None
-        best_score = 0
         
+        # One automaton over every keyword, so matching is a single pass over the input;
+        # a keyword shared by several patterns maps to all of them
+        keyword_patterns = {}
         for pattern_name, pattern_data in self.query_patterns.items():
-            score = 0
             for keyword in pattern_data['keywords']:
-                if keyword in user_input_lower:
-                    score += 1
-            
-            if score > best_score:
-                best_score = score
-                best_match = pattern_name
+                keyword_patterns.setdefault(keyword, []).append(pattern_name)
+        self._keyword_automaton = ahocorasick.Automaton()
+        for keyword, pattern_names in keyword_patterns.items():
+            self._keyword_automaton.add_word(keyword, (keyword, tuple(pattern_names)))
+        self._keyword_automaton.make_automaton()
+    
+    def _cursor(self, **kwargs):
+        """Open a cursor on the shared connection, reconnecting if it was closed"""
+        if self.conn is None or self.conn.closed:
+            self.conn = psycopg2.connect(**self.db_config)
+            # Read-only queries; don't leave the reused connection idle in transaction
+            self.conn.autocommit = True
+            self._prepared.clear()
+        return self.conn.cursor(**kwargs)
+    
+    def _execute_pattern(self, cursor, pattern_name):
+        """Run a canned query, preparing it on this connection the first time it is used"""
+        if pattern_name not in self._prepared:
+            # Under autocommit a failed PREPARE leaves the session usable,
+            # and the pattern is retried on its next use
+            cursor.execute(f"PREPARE q_{pattern_name} AS {self.query_patterns[pattern_name]['query']}")
+            self._prepared.add(pattern_name)
+        cursor.execute(f"EXECUTE q_{pattern_name}")
+    
+    def close(self):
+        """Close the shared database connection"""
+        if self.conn is not None and not self.conn.closed:
+            self.conn.close()
+        self.conn = None
+        self._prepared.clear()
+    
+    def get_matching_query(self, user_input):
+        """Find the best matching query based on user input"""
+        # Each distinct keyword scores once, however often it appears
+        hits = {value for _, value in self._keyword_automaton.iter(user_input.lower())}
+        if not hits:
+            return None
         
-        return best_match
+        scores = Counter(pattern_name for _, pattern_names in hits for pattern_name in pattern_names)
+        # max() keeps the first pattern on ties, matching declaration order
+        return max(self.query_patterns, key=scores.__getitem__)
     
     def run_query(self, user_input):
         """Run a natural language query against the database"""
@@ -193,15 +233,12 @@ class SimpleSREDatabaseAgent:
                     print(f"  • {', '.join(pattern_data['keywords'])}")
                 return None
             
-            # Execute the query
-            query = self.query_patterns[pattern_name]['query']
+            # Execute the query via its server-side prepared statement
             print(f"📊 Executing query for: {pattern_name}")
             
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            cursor.execute(query)
-            results = cursor.fetchall()
+            with self._cursor(cursor_factory=RealDictCursor) as cursor:
+                self._execute_pattern(cursor, pattern_name)
+                results = cursor.fetchall()
             
             if not results:
                 print("📭 No data found for this query.")
@@ -211,15 +248,18 @@ class SimpleSREDatabaseAgent:
             print(f"📈 Found {len(results)} results:")
             print("-" * 40)
             
-            for i, row in enumerate(results, 1):
-                print(f"{i}. {dict(row)}")
-            
-            cursor.close()
-            conn.close()
+            # One write for all rows instead of a print per row. RealDictRow is an
+            # OrderedDict, so dict's repr prints it as a plain dict without copying it
+            sys.stdout.write("".join(f"{i}. {dict.__repr__(row)}\n" for i, row in enumerate(results, 1)))
             
             print("=" * 60)
             return results
             
+        except psycopg2.OperationalError as e:
+            # Connection dropped; discard it so the next query reconnects
+            self.close()
+            print(f"❌ Error running query: {e}")
+            return None
         except Exception as e:
             print(f"❌ Error running query: {e}")
             return None
@@ -227,16 +267,20 @@ class SimpleSREDatabaseAgent:
     def get_database_info(self):
         """Get information about the database tables and data"""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
+            cursor = self._cursor()
             
-            # Get table information
+            # Get table, column and row counts in a single round trip;
+            # row counts come from the planner statistics (n_live_tup)
             cursor.execute("""
-                SELECT table_name, 
-                       (SELECT COUNT(*) FROM information_schema.columns WHERE table_name = t.table_name) as column_count
+                SELECT t.table_name,
+                       COALESCE(s.n_live_tup, 0) as row_count,
+                       (SELECT COUNT(*) FROM information_schema.columns c
+                        WHERE c.table_schema = t.table_schema AND c.table_name = t.table_name) as column_count
                 FROM information_schema.tables t
-                WHERE table_schema = 'public'
-                ORDER BY table_name
+                LEFT JOIN pg_stat_user_tables s
+                  ON s.schemaname = t.table_schema AND s.relname = t.table_name
+                WHERE t.table_schema = 'public'
+                ORDER BY t.table_name
             """)
             
             tables = cursor.fetchall()
@@ -244,14 +288,14 @@ class SimpleSREDatabaseAgent:
             print("🗄️  Database Information:")
             print("=" * 40)
             
-            for table_name, column_count in tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                row_count = cursor.fetchone()[0]
+            for table_name, row_count, column_count in tables:
                 print(f"📋 {table_name}: {row_count} rows, {column_count} columns")
             
             cursor.close()
-            conn.close()
             
+        except psycopg2.OperationalError as e:
+            self.close()
+            print(f"❌ Error getting database info: {e}")
         except Exception as e:
             print(f"❌ Error getting database info: {e}")
     
@@ -350,6 +394,8 @@ def main():
         print("\n👋 Goodbye!")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        agent.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file